@@ -2,12 +2,6 @@
 
 __version__ = "0.1.0"
 
-# Import essential classes and functions for public API
-from pi_tv_remote.cec_adapter import CECAdapter, CECCommand, CECConfig, RemoteButton
-
-# Import main function for CLI use
-from pi_tv_remote.cli import main
-
 __all__ = [
     "CECAdapter",
     "CECConfig",
@@ -15,3 +9,25 @@ __all__ = [
     "CECCommand",
     "main",
 ]
+
+# Public names are resolved on first access so that importing the package
+# (e.g. for ``pi_tv_remote --help``) does not load the CEC module
+_LAZY_ATTRS = {
+    "CECAdapter": "pi_tv_remote.cec_adapter",
+    "CECConfig": "pi_tv_remote.cec_adapter",
+    "RemoteButton": "pi_tv_remote.cec_adapter",
+    "CECCommand": "pi_tv_remote.cec_adapter",
+    "main": "pi_tv_remote.cli",
+}
+
+
+def __getattr__(name: str):
+    """Import public names from their defining module on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -5,230 +5,370 @@ CEC Adapter for Raspberry Pi
 - Processes callbacks for remote control commands
 """
 
-import datetime
+import asyncio
+import functools
 import sys
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
-
-from pydantic import BaseModel, Field
+from collections import defaultdict
+from enum import IntEnum
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 
 from .cec_utils import get_cec_module
 
 # Import appropriate CEC module
 cec = get_cec_module()
 debug_mode = False
+_time = time.time
+_strftime = time.strftime
+_localtime = time.localtime
+
+# Slots in the CEC event ring buffer (a power of two so we can mask indices)
+_RING_SIZE = 1024
+_RING_MASK = _RING_SIZE - 1
+
+# Maximum number of queued CEC events dispatched per worker pass
+_EVENT_BATCH_SIZE = 64
+
+
+# Last formatted whole second, reused while events keep landing in it
+_clock_cache: Tuple[int, str] = (-1, "")
+
+
+def _clock(second: int) -> str:
+    """Return "HH:MM:SS" for an epoch second, formatting only when it changes."""
+    global _clock_cache
+    cached_second, text = _clock_cache
+    if second != cached_second:
+        text = _strftime("%H:%M:%S", _localtime(second))
+        _clock_cache = (second, text)
+    return text
 
 
 # Debug logging function with timestamps
-def log_debug(message, level="INFO"):
-    """Log a debug message with timestamp"""
-    if debug_mode:
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        print(f"[{timestamp}] [{level}] {message}")
+def _log_debug(fmt, *args, level="INFO"):
+    """Log a debug message with timestamp, formatting it only when enabled"""
+    if not debug_mode:
+        return
+    message = fmt % args if args else fmt
+    now = _time()
+    timestamp = f"{_clock(int(now))}.{int(now % 1 * 1000):03d}"
+    print(f"[{timestamp}] [{level}] {message}")
+
+
+def _no_log(*args, **kwargs):
+    """Discard a debug message (used in place of log_debug when debug is off)"""
+
+
+# Modules importing log_debug keep this guarded version; CECAdapter rebinds the
+# module global so calls inside this module skip straight to _no_log
+log_debug = _log_debug
+
+
+def _cec_value(names: Tuple[str, ...], default: int) -> int:
+    """Return the first of names defined by the cec module, else default."""
+    for name in names:
+        value = getattr(cec, name, None)
+        if value is not None:
+            return int(value)
+    return default
+
+
+def _check_constants(
+    target_cls: Type[IntEnum],
+    mapping: Dict[str, Tuple[str, ...]],
+    cec_module: Any,
+) -> None:
+    """
+    Raise ValueError if cec_module defines a constant that differs from the
+    matching target_cls member. Members take their values from the cec module
+    at import time and cannot change afterwards.
+    """
+    for our_name, possible_names in mapping.items():
+        for name in possible_names:
+            value = getattr(cec_module, name, None)
+            if value is not None:
+                member = target_cls[our_name]
+                if value != member.value:
+                    raise ValueError(
+                        f"{target_cls.__name__}.{our_name} is 0x{member.value:02x}"
+                        f" but {name} is 0x{value:02x} in the cec module"
+                    )
+                break
+
+
+# Map our button names to CEC module constant names
+_BUTTON_MAPPING: Dict[str, Tuple[str, ...]] = {
+    "SELECT": ("CEC_USER_CONTROL_CODE_SELECT", "CEC_USER_CONTROL_SELECT"),
+    "UP": ("CEC_USER_CONTROL_CODE_UP", "CEC_USER_CONTROL_UP"),
+    "DOWN": ("CEC_USER_CONTROL_CODE_DOWN", "CEC_USER_CONTROL_DOWN"),
+    "LEFT": ("CEC_USER_CONTROL_CODE_LEFT", "CEC_USER_CONTROL_LEFT"),
+    "RIGHT": ("CEC_USER_CONTROL_CODE_RIGHT", "CEC_USER_CONTROL_RIGHT"),
+    "BACK": (
+        "CEC_USER_CONTROL_CODE_EXIT",
+        "CEC_USER_CONTROL_EXIT",
+        "CEC_USER_CONTROL_BACK",
+    ),
+    "VOLUME_UP": (
+        "CEC_USER_CONTROL_CODE_VOLUME_UP",
+        "CEC_USER_CONTROL_VOLUME_UP",
+    ),
+    "VOLUME_DOWN": (
+        "CEC_USER_CONTROL_CODE_VOLUME_DOWN",
+        "CEC_USER_CONTROL_VOLUME_DOWN",
+    ),
+    "MUTE": (
+        "CEC_USER_CONTROL_CODE_MUTE",
+        "CEC_USER_CONTROL_MUTE",
+        "CEC_USER_CONTROL_MUTE_TOGGLE",
+    ),
+    "PLAY": ("CEC_USER_CONTROL_CODE_PLAY", "CEC_USER_CONTROL_PLAY"),
+    "STOP": ("CEC_USER_CONTROL_CODE_STOP", "CEC_USER_CONTROL_STOP"),
+    "PAUSE": ("CEC_USER_CONTROL_CODE_PAUSE", "CEC_USER_CONTROL_PAUSE"),
+    "REWIND": ("CEC_USER_CONTROL_CODE_REWIND", "CEC_USER_CONTROL_REWIND"),
+    "FAST_FORWARD": (
+        "CEC_USER_CONTROL_CODE_FAST_FORWARD",
+        "CEC_USER_CONTROL_FAST_FORWARD",
+    ),
+    "BLUE": (
+        "CEC_USER_CONTROL_CODE_F1_BLUE",
+        "CEC_USER_CONTROL_F1_BLUE",
+        "CEC_USER_CONTROL_BLUE",
+    ),
+    "RED": (
+        "CEC_USER_CONTROL_CODE_F2_RED",
+        "CEC_USER_CONTROL_F2_RED",
+        "CEC_USER_CONTROL_RED",
+    ),
+    "GREEN": (
+        "CEC_USER_CONTROL_CODE_F3_GREEN",
+        "CEC_USER_CONTROL_F3_GREEN",
+        "CEC_USER_CONTROL_GREEN",
+    ),
+    "YELLOW": (
+        "CEC_USER_CONTROL_CODE_F4_YELLOW",
+        "CEC_USER_CONTROL_F4_YELLOW",
+        "CEC_USER_CONTROL_YELLOW",
+    ),
+    # Number keys
+    "NUMBER_0": ("CEC_USER_CONTROL_CODE_NUMBER0", "CEC_USER_CONTROL_NUMBER_0"),
+    "NUMBER_1": ("CEC_USER_CONTROL_CODE_NUMBER1", "CEC_USER_CONTROL_NUMBER_1"),
+    "NUMBER_2": ("CEC_USER_CONTROL_CODE_NUMBER2", "CEC_USER_CONTROL_NUMBER_2"),
+    "NUMBER_3": ("CEC_USER_CONTROL_CODE_NUMBER3", "CEC_USER_CONTROL_NUMBER_3"),
+    "NUMBER_4": ("CEC_USER_CONTROL_CODE_NUMBER4", "CEC_USER_CONTROL_NUMBER_4"),
+    "NUMBER_5": ("CEC_USER_CONTROL_CODE_NUMBER5", "CEC_USER_CONTROL_NUMBER_5"),
+    "NUMBER_6": ("CEC_USER_CONTROL_CODE_NUMBER6", "CEC_USER_CONTROL_NUMBER_6"),
+    "NUMBER_7": ("CEC_USER_CONTROL_CODE_NUMBER7", "CEC_USER_CONTROL_NUMBER_7"),
+    "NUMBER_8": ("CEC_USER_CONTROL_CODE_NUMBER8", "CEC_USER_CONTROL_NUMBER_8"),
+    "NUMBER_9": ("CEC_USER_CONTROL_CODE_NUMBER9", "CEC_USER_CONTROL_NUMBER_9"),
+}
 
 
 # Define remote button mappings
-class RemoteButton:
+class RemoteButton(IntEnum):
     """
     Remote button mappings, using the real CEC module's constants when available.
     We maintain our own naming convention for consistency but use the official values.
+    Reverse lookup by code is RemoteButton(key_code).name.
     """
 
     # Standard navigation buttons
-    SELECT = 0x00  # Will be overridden if cec module has the constant
-    UP = 0x01
-    DOWN = 0x02
-    LEFT = 0x03
-    RIGHT = 0x04
-    BACK = 0x0D  # EXIT in CEC spec
+    SELECT = _cec_value(_BUTTON_MAPPING["SELECT"], 0x00)
+    UP = _cec_value(_BUTTON_MAPPING["UP"], 0x01)
+    DOWN = _cec_value(_BUTTON_MAPPING["DOWN"], 0x02)
+    LEFT = _cec_value(_BUTTON_MAPPING["LEFT"], 0x03)
+    RIGHT = _cec_value(_BUTTON_MAPPING["RIGHT"], 0x04)
+    BACK = _cec_value(_BUTTON_MAPPING["BACK"], 0x0D)  # EXIT in CEC spec
 
     # Volume controls
-    VOLUME_UP = 0x41
-    VOLUME_DOWN = 0x42
-    MUTE = 0x43
+    VOLUME_UP = _cec_value(_BUTTON_MAPPING["VOLUME_UP"], 0x41)
+    VOLUME_DOWN = _cec_value(_BUTTON_MAPPING["VOLUME_DOWN"], 0x42)
+    MUTE = _cec_value(_BUTTON_MAPPING["MUTE"], 0x43)
 
     # Playback control
-    STOP = 0x45
-    PLAY = 0x44
-    PAUSE = 0x46
-    REWIND = 0x48
-    FAST_FORWARD = 0x49
+    STOP = _cec_value(_BUTTON_MAPPING["STOP"], 0x45)
+    PLAY = _cec_value(_BUTTON_MAPPING["PLAY"], 0x44)
+    PAUSE = _cec_value(_BUTTON_MAPPING["PAUSE"], 0x46)
+    REWIND = _cec_value(_BUTTON_MAPPING["REWIND"], 0x48)
+    FAST_FORWARD = _cec_value(_BUTTON_MAPPING["FAST_FORWARD"], 0x49)
 
     # Color buttons
-    BLUE = 0x71
-    RED = 0x72
-    GREEN = 0x73
-    YELLOW = 0x74
+    BLUE = _cec_value(_BUTTON_MAPPING["BLUE"], 0x71)
+    RED = _cec_value(_BUTTON_MAPPING["RED"], 0x72)
+    GREEN = _cec_value(_BUTTON_MAPPING["GREEN"], 0x73)
+    YELLOW = _cec_value(_BUTTON_MAPPING["YELLOW"], 0x74)
 
     # Number keys
-    NUMBER_0 = 0x20
-    NUMBER_1 = 0x21
-    NUMBER_2 = 0x22
-    NUMBER_3 = 0x23
-    NUMBER_4 = 0x24
-    NUMBER_5 = 0x25
-    NUMBER_6 = 0x26
-    NUMBER_7 = 0x27
-    NUMBER_8 = 0x28
-    NUMBER_9 = 0x29
-
-    # Update button codes from the real CEC module
+    NUMBER_0 = _cec_value(_BUTTON_MAPPING["NUMBER_0"], 0x20)
+    NUMBER_1 = _cec_value(_BUTTON_MAPPING["NUMBER_1"], 0x21)
+    NUMBER_2 = _cec_value(_BUTTON_MAPPING["NUMBER_2"], 0x22)
+    NUMBER_3 = _cec_value(_BUTTON_MAPPING["NUMBER_3"], 0x23)
+    NUMBER_4 = _cec_value(_BUTTON_MAPPING["NUMBER_4"], 0x24)
+    NUMBER_5 = _cec_value(_BUTTON_MAPPING["NUMBER_5"], 0x25)
+    NUMBER_6 = _cec_value(_BUTTON_MAPPING["NUMBER_6"], 0x26)
+    NUMBER_7 = _cec_value(_BUTTON_MAPPING["NUMBER_7"], 0x27)
+    NUMBER_8 = _cec_value(_BUTTON_MAPPING["NUMBER_8"], 0x28)
+    NUMBER_9 = _cec_value(_BUTTON_MAPPING["NUMBER_9"], 0x29)
+
+    # Check button codes against the real CEC module
     @classmethod
     def update_from_module(cls, cec_module):
-        """Update button codes from the real CEC module."""
-        # Map our button names to CEC module constant names
-        button_mapping = {
-            "SELECT": ["CEC_USER_CONTROL_CODE_SELECT", "CEC_USER_CONTROL_SELECT"],
-            "UP": ["CEC_USER_CONTROL_CODE_UP", "CEC_USER_CONTROL_UP"],
-            "DOWN": ["CEC_USER_CONTROL_CODE_DOWN", "CEC_USER_CONTROL_DOWN"],
-            "LEFT": ["CEC_USER_CONTROL_CODE_LEFT", "CEC_USER_CONTROL_LEFT"],
-            "RIGHT": ["CEC_USER_CONTROL_CODE_RIGHT", "CEC_USER_CONTROL_RIGHT"],
-            "BACK": [
-                "CEC_USER_CONTROL_CODE_EXIT",
-                "CEC_USER_CONTROL_EXIT",
-                "CEC_USER_CONTROL_BACK",
-            ],
-            "VOLUME_UP": [
-                "CEC_USER_CONTROL_CODE_VOLUME_UP",
-                "CEC_USER_CONTROL_VOLUME_UP",
-            ],
-            "VOLUME_DOWN": [
-                "CEC_USER_CONTROL_CODE_VOLUME_DOWN",
-                "CEC_USER_CONTROL_VOLUME_DOWN",
-            ],
-            "MUTE": [
-                "CEC_USER_CONTROL_CODE_MUTE",
-                "CEC_USER_CONTROL_MUTE",
-                "CEC_USER_CONTROL_MUTE_TOGGLE",
-            ],
-            "PLAY": ["CEC_USER_CONTROL_CODE_PLAY", "CEC_USER_CONTROL_PLAY"],
-            "STOP": ["CEC_USER_CONTROL_CODE_STOP", "CEC_USER_CONTROL_STOP"],
-            "PAUSE": ["CEC_USER_CONTROL_CODE_PAUSE", "CEC_USER_CONTROL_PAUSE"],
-            "REWIND": ["CEC_USER_CONTROL_CODE_REWIND", "CEC_USER_CONTROL_REWIND"],
-            "FAST_FORWARD": [
-                "CEC_USER_CONTROL_CODE_FAST_FORWARD",
-                "CEC_USER_CONTROL_FAST_FORWARD",
-            ],
-            "BLUE": [
-                "CEC_USER_CONTROL_CODE_F1_BLUE",
-                "CEC_USER_CONTROL_F1_BLUE",
-                "CEC_USER_CONTROL_BLUE",
-            ],
-            "RED": [
-                "CEC_USER_CONTROL_CODE_F2_RED",
-                "CEC_USER_CONTROL_F2_RED",
-                "CEC_USER_CONTROL_RED",
-            ],
-            "GREEN": [
-                "CEC_USER_CONTROL_CODE_F3_GREEN",
-                "CEC_USER_CONTROL_F3_GREEN",
-                "CEC_USER_CONTROL_GREEN",
-            ],
-            "YELLOW": [
-                "CEC_USER_CONTROL_CODE_F4_YELLOW",
-                "CEC_USER_CONTROL_F4_YELLOW",
-                "CEC_USER_CONTROL_YELLOW",
-            ],
-            # Number keys
-            "NUMBER_0": ["CEC_USER_CONTROL_CODE_NUMBER0", "CEC_USER_CONTROL_NUMBER_0"],
-            "NUMBER_1": ["CEC_USER_CONTROL_CODE_NUMBER1", "CEC_USER_CONTROL_NUMBER_1"],
-            "NUMBER_2": ["CEC_USER_CONTROL_CODE_NUMBER2", "CEC_USER_CONTROL_NUMBER_2"],
-            "NUMBER_3": ["CEC_USER_CONTROL_CODE_NUMBER3", "CEC_USER_CONTROL_NUMBER_3"],
-            "NUMBER_4": ["CEC_USER_CONTROL_CODE_NUMBER4", "CEC_USER_CONTROL_NUMBER_4"],
-            "NUMBER_5": ["CEC_USER_CONTROL_CODE_NUMBER5", "CEC_USER_CONTROL_NUMBER_5"],
-            "NUMBER_6": ["CEC_USER_CONTROL_CODE_NUMBER6", "CEC_USER_CONTROL_NUMBER_6"],
-            "NUMBER_7": ["CEC_USER_CONTROL_CODE_NUMBER7", "CEC_USER_CONTROL_NUMBER_7"],
-            "NUMBER_8": ["CEC_USER_CONTROL_CODE_NUMBER8", "CEC_USER_CONTROL_NUMBER_8"],
-            "NUMBER_9": ["CEC_USER_CONTROL_CODE_NUMBER9", "CEC_USER_CONTROL_NUMBER_9"],
-        }
-
-        # Try to get each constant from the module
-        for our_name, possible_names in button_mapping.items():
-            for name in possible_names:
-                if hasattr(cec_module, name):
-                    setattr(cls, our_name, getattr(cec_module, name))
-                    break
-
-
-class CECCommand:
+        """Check button codes against the real CEC module (raises ValueError)."""
+        _check_constants(cls, _BUTTON_MAPPING, cec_module)
+
+
+# Map our command names to CEC module constant names
+_COMMAND_MAPPING: Dict[str, Tuple[str, ...]] = {
+    "IMAGE_VIEW_ON": ("CEC_OPCODE_IMAGE_VIEW_ON",),
+    "STANDBY": ("CEC_OPCODE_STANDBY",),
+    "GIVE_DEVICE_POWER_STATUS": ("CEC_OPCODE_GIVE_DEVICE_POWER_STATUS",),
+    "REPORT_POWER_STATUS": ("CEC_OPCODE_REPORT_POWER_STATUS",),
+    "ACTIVE_SOURCE": ("CEC_OPCODE_ACTIVE_SOURCE",),
+    "SET_STREAM_PATH": ("CEC_OPCODE_SET_STREAM_PATH",),
+    "ROUTING_CHANGE": ("CEC_OPCODE_ROUTING_CHANGE",),
+    "GIVE_PHYSICAL_ADDR": ("CEC_OPCODE_GIVE_PHYSICAL_ADDR",),
+    "REPORT_PHYSICAL_ADDR": ("CEC_OPCODE_REPORT_PHYSICAL_ADDR",),
+    "GIVE_OSD_NAME": ("CEC_OPCODE_GIVE_OSD_NAME",),
+    "SET_OSD_NAME": ("CEC_OPCODE_SET_OSD_NAME",),
+    "GIVE_DEVICE_VENDOR_ID": ("CEC_OPCODE_GIVE_DEVICE_VENDOR_ID",),
+    "DEVICE_VENDOR_ID": ("CEC_OPCODE_DEVICE_VENDOR_ID",),
+    "GIVE_DECK_STATUS": ("CEC_OPCODE_GIVE_DECK_STATUS",),
+    "DECK_STATUS": ("CEC_OPCODE_DECK_STATUS",),
+    "USER_CONTROL_PRESSED": ("CEC_OPCODE_USER_CONTROL_PRESSED",),
+    "USER_CONTROL_RELEASED": ("CEC_OPCODE_USER_CONTROL_RELEASED",),
+    "VENDOR_COMMAND": ("CEC_OPCODE_VENDOR_COMMAND",),
+}
+
+
+class CECCommand(IntEnum):
     """
     CEC command opcodes, using the real CEC module's constants when available.
     This class provides convenient access to common CEC command opcodes.
     """
 
     # TV power control
-    IMAGE_VIEW_ON = 0x04
-    STANDBY = 0x36
+    IMAGE_VIEW_ON = _cec_value(_COMMAND_MAPPING["IMAGE_VIEW_ON"], 0x04)
+    STANDBY = _cec_value(_COMMAND_MAPPING["STANDBY"], 0x36)
 
     # Device status
-    GIVE_DEVICE_POWER_STATUS = 0x8F
-    REPORT_POWER_STATUS = 0x90
+    GIVE_DEVICE_POWER_STATUS = _cec_value(
+        _COMMAND_MAPPING["GIVE_DEVICE_POWER_STATUS"], 0x8F
+    )
+    REPORT_POWER_STATUS = _cec_value(_COMMAND_MAPPING["REPORT_POWER_STATUS"], 0x90)
 
     # Routing control
-    ACTIVE_SOURCE = 0x82
-    SET_STREAM_PATH = 0x86
-    ROUTING_CHANGE = 0x80
+    ACTIVE_SOURCE = _cec_value(_COMMAND_MAPPING["ACTIVE_SOURCE"], 0x82)
+    SET_STREAM_PATH = _cec_value(_COMMAND_MAPPING["SET_STREAM_PATH"], 0x86)
+    ROUTING_CHANGE = _cec_value(_COMMAND_MAPPING["ROUTING_CHANGE"], 0x80)
 
     # Device information
-    GIVE_PHYSICAL_ADDR = 0x83
-    REPORT_PHYSICAL_ADDR = 0x84
-    GIVE_OSD_NAME = 0x46
-    SET_OSD_NAME = 0x47
-    GIVE_DEVICE_VENDOR_ID = 0x8C
-    DEVICE_VENDOR_ID = 0x87
+    GIVE_PHYSICAL_ADDR = _cec_value(_COMMAND_MAPPING["GIVE_PHYSICAL_ADDR"], 0x83)
+    REPORT_PHYSICAL_ADDR = _cec_value(_COMMAND_MAPPING["REPORT_PHYSICAL_ADDR"], 0x84)
+    GIVE_OSD_NAME = _cec_value(_COMMAND_MAPPING["GIVE_OSD_NAME"], 0x46)
+    SET_OSD_NAME = _cec_value(_COMMAND_MAPPING["SET_OSD_NAME"], 0x47)
+    GIVE_DEVICE_VENDOR_ID = _cec_value(_COMMAND_MAPPING["GIVE_DEVICE_VENDOR_ID"], 0x8C)
+    DEVICE_VENDOR_ID = _cec_value(_COMMAND_MAPPING["DEVICE_VENDOR_ID"], 0x87)
 
     # Deck control
-    GIVE_DECK_STATUS = 0x1A
-    DECK_STATUS = 0x1B
+    GIVE_DECK_STATUS = _cec_value(_COMMAND_MAPPING["GIVE_DECK_STATUS"], 0x1A)
+    DECK_STATUS = _cec_value(_COMMAND_MAPPING["DECK_STATUS"], 0x1B)
 
     # Remote control
-    USER_CONTROL_PRESSED = 0x44
-    USER_CONTROL_RELEASED = 0x45
+    USER_CONTROL_PRESSED = _cec_value(_COMMAND_MAPPING["USER_CONTROL_PRESSED"], 0x44)
+    USER_CONTROL_RELEASED = _cec_value(_COMMAND_MAPPING["USER_CONTROL_RELEASED"], 0x45)
 
     # Vendor specific
-    VENDOR_COMMAND = 0x89
+    VENDOR_COMMAND = _cec_value(_COMMAND_MAPPING["VENDOR_COMMAND"], 0x89)
 
     @classmethod
     def update_from_module(cls, cec_module):
-        """Update command opcodes from the real CEC module."""
-        # Map our command names to CEC module constant names
-        command_mapping = {
-            "IMAGE_VIEW_ON": ["CEC_OPCODE_IMAGE_VIEW_ON"],
-            "STANDBY": ["CEC_OPCODE_STANDBY"],
-            "GIVE_DEVICE_POWER_STATUS": ["CEC_OPCODE_GIVE_DEVICE_POWER_STATUS"],
-            "REPORT_POWER_STATUS": ["CEC_OPCODE_REPORT_POWER_STATUS"],
-            "ACTIVE_SOURCE": ["CEC_OPCODE_ACTIVE_SOURCE"],
-            "SET_STREAM_PATH": ["CEC_OPCODE_SET_STREAM_PATH"],
-            "ROUTING_CHANGE": ["CEC_OPCODE_ROUTING_CHANGE"],
-            "GIVE_PHYSICAL_ADDR": ["CEC_OPCODE_GIVE_PHYSICAL_ADDR"],
-            "REPORT_PHYSICAL_ADDR": ["CEC_OPCODE_REPORT_PHYSICAL_ADDR"],
-            "GIVE_OSD_NAME": ["CEC_OPCODE_GIVE_OSD_NAME"],
-            "SET_OSD_NAME": ["CEC_OPCODE_SET_OSD_NAME"],
-            "GIVE_DEVICE_VENDOR_ID": ["CEC_OPCODE_GIVE_DEVICE_VENDOR_ID"],
-            "DEVICE_VENDOR_ID": ["CEC_OPCODE_DEVICE_VENDOR_ID"],
-            "GIVE_DECK_STATUS": ["CEC_OPCODE_GIVE_DECK_STATUS"],
-            "DECK_STATUS": ["CEC_OPCODE_DECK_STATUS"],
-            "USER_CONTROL_PRESSED": ["CEC_OPCODE_USER_CONTROL_PRESSED"],
-            "USER_CONTROL_RELEASED": ["CEC_OPCODE_USER_CONTROL_RELEASED"],
-            "VENDOR_COMMAND": ["CEC_OPCODE_VENDOR_COMMAND"],
-        }
-
-        # Try to get each constant from the module
-        for our_name, possible_names in command_mapping.items():
-            for name in possible_names:
-                if hasattr(cec_module, name):
-                    setattr(cls, our_name, getattr(cec_module, name))
-                    break
+        """Check command opcodes against the real CEC module (raises ValueError)."""
+        _check_constants(cls, _COMMAND_MAPPING, cec_module)
 
 
 class CECConfig(BaseModel):
     """Configuration for the CEC adapter."""
 
+    # Validate and re-derive physical_address_bytes when fields are assigned
+    model_config = ConfigDict(validate_assignment=True)
+
     device_name: str = Field(default="RaspberryPi")
     physical_address: str = Field(default="1.0.0.0")
     port: int = Field(default=1)
     auto_power_on: bool = Field(default=True)
     device_type: int = Field(default=1)  # Default to Recording Device
+    # Repeated presses of a key within this many seconds are dropped (0 disables)
+    key_repeat_interval: float = Field(default=0.04, ge=0)
+
+    # Encoded physical address, derived from physical_address on every change
+    _physical_address_bytes: bytes = PrivateAttr(default=b"")
+
+    @field_validator("physical_address")
+    @classmethod
+    def _check_physical_address(cls, value: str) -> str:
+        """Require the CEC physical address form "a.b.c.d" with hex digits."""
+        parts = value.split(".")
+        if len(parts) != 4 or not all(
+            len(part) == 1 and part in "0123456789abcdefABCDEF" for part in parts
+        ):
+            raise ValueError(
+                f"physical_address must look like '1.0.0.0', got {value!r}"
+            )
+        return value
+
+    @model_validator(mode="after")
+    def _encode_physical_address(self) -> "CECConfig":
+        """Encode physical_address into the bytes sent in CEC frames."""
+        self._physical_address_bytes = bytes.fromhex(
+            self.physical_address.replace(".", "")
+        )
+        return self
+
+    @property
+    def physical_address_bytes(self) -> bytes:
+        """The physical address as the two bytes sent in CEC frames."""
+        return self._physical_address_bytes
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _require_init(action: str, default: Any) -> Callable[[F], F]:
+    """Make a CECAdapter method log and return default unless initialized."""
+
+    def decorator(method: F) -> F:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.initialized:
+                log_debug("CEC not initialized, cannot %s", action, level="ERROR")
+                return default
+            return method(self, *args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
 
 
 class CECAdapter:
@@ -244,22 +384,53 @@ class CECAdapter:
         """
         self.config = config or CECConfig()
         self.initialized = False
-        self.callbacks: Dict[int, List[Callable]] = {}
-        self.command_callbacks: Dict[int, List[Callable]] = {}
-
-        global debug_mode
+        self.callbacks: DefaultDict[int, List[Callable]] = defaultdict(list)
+        self.command_callbacks: DefaultDict[int, List[Callable]] = defaultdict(list)
+        self._stop_event = threading.Event()
+        # Loop and event of a pending run_async(), woken by stop()
+        self._async_stop: Optional[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Event]
+        ] = None
+        # Single-producer/single-consumer ring buffer between the libcec
+        # callback thread (writes tail) and the dispatch worker (reads head)
+        self._ring: List[Optional[Tuple[Callable, tuple]]] = [None] * _RING_SIZE
+        self._ring_head = 0
+        self._ring_tail = 0
+        self._ring_ready = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_running = False
+        # Guards starting the worker against a previous one deciding to exit
+        self._worker_lock = threading.Lock()
+        self._last_keypress: Dict[int, float] = {}
+
+        # Optional cec module functions, resolved once in init()
+        self._cec_close: Optional[Callable] = None
+        self._cec_add_callback: Optional[Callable] = None
+        self._cec_remove_callback: Optional[Callable] = None
+        self._cec_set_active_source: Optional[Callable] = None
+
+        global debug_mode, log_debug
         debug_mode = debug
+        log_debug = _log_debug if debug else _no_log
 
-        log_debug("Running in DEBUG mode - CEC operations will be simulated", "WARNING")
+        log_debug(
+            "Running in DEBUG mode - CEC operations will be simulated", level="WARNING"
+        )
 
         # Import CEC module
         global cec
         cec = get_cec_module()
 
-        # Update RemoteButton class with constants from the real cec module
+        # Bind frequently used module constants once
+        self._tv_addr: int = cec.CECDEVICE_TV
+        self._bcast_addr: int = cec.CECDEVICE_BROADCAST
+        self._event_keypress: int = cec.EVENT_KEYPRESS
+        self._event_command: int = cec.EVENT_COMMAND
+
+        # Check RemoteButton against the constants of the real cec module
         RemoteButton.update_from_module(cec)
 
-        # Update CECCommand class with constants from the real cec module
+        # Check CECCommand against the constants of the real cec module
         CECCommand.update_from_module(cec)
 
     def init(self) -> bool:
@@ -267,27 +438,39 @@ class CECAdapter:
         Initialize the CEC connection using the simplest approach.
         Based on successful tests with python-cec.
         """
-        log_debug("Starting CEC initialization", "DEBUG")
+        log_debug("Starting CEC initialization", level="DEBUG")
         start_time = time.time()
 
         try:
             # Simple initialization with default adapter - this is the key simplification
-            log_debug("Initializing CEC with default adapter", "DEBUG")
+            log_debug("Initializing CEC with default adapter", level="DEBUG")
             cec.init()
-            log_debug("CEC initialization successful", "SUCCESS")
+            log_debug("CEC initialization successful", level="SUCCESS")
+
+            # Resolve which optional module functions this cec build provides
+            self._cec_close = getattr(cec, "close", None) or getattr(
+                cec, "shutdown", None
+            )
+            self._cec_add_callback = getattr(cec, "add_callback", None)
+            self._cec_remove_callback = getattr(cec, "remove_callback", None)
+            self._cec_set_active_source = getattr(cec, "set_active_source", None)
+
+            # Dispatch CEC events off the libcec callback thread
+            self._start_worker()
 
             # Register events if needed
             self.register_event_handlers()
 
             self.initialized = True
             log_debug(
-                f"Total initialization time: {time.time() - start_time:.2f} seconds",
-                "DEBUG",
+                "Total initialization time: %.2f seconds",
+                time.time() - start_time,
+                level="DEBUG",
             )
             return True
 
         except Exception as e:
-            log_debug(f"Error initializing CEC: {e}", "ERROR")
+            log_debug("Error initializing CEC: %s", e, level="ERROR")
             return False
 
     def cleanup(self) -> None:
@@ -295,34 +478,54 @@ class CECAdapter:
         if not self.initialized:
             return
 
-        log_debug("Cleaning up CEC resources", "DEBUG")
+        log_debug("Cleaning up CEC resources", level="DEBUG")
+
+        # Release anyone blocked in run()
+        self.stop()
 
         # Unregister event handlers
         self.unregister_event_handlers()
 
+        # Let the dispatch worker finish what is already queued
+        self._stop_worker()
+
         # Try to close the connection if that function exists
         try:
-            if hasattr(cec, "close"):
-                cec.close()
-                log_debug("CEC connection closed via close()", "DEBUG")
-            elif hasattr(cec, "shutdown"):
-                cec.shutdown()
-                log_debug("CEC connection closed via shutdown()", "DEBUG")
+            if self._cec_close is not None:
+                self._cec_close()
+                log_debug(
+                    "CEC connection closed via %s()",
+                    self._cec_close.__name__,
+                    level="DEBUG",
+                )
             else:
-                log_debug("No cleanup function available (close/shutdown)", "WARNING")
+                log_debug(
+                    "No cleanup function available (close/shutdown)", level="WARNING"
+                )
         except Exception as e:
-            log_debug(f"Error during CEC cleanup: {e}", "ERROR")
+            log_debug("Error during CEC cleanup: %s", e, level="ERROR")
 
-            self.initialized = False
+        self.initialized = False
 
     def add_button_callback(self, button_code: int, callback: Callable) -> None:
         """Add a callback for a specific remote button press."""
-        if button_code not in self.callbacks:
-            self.callbacks[button_code] = []
-        self.callbacks[button_code].append(callback)
+        # Plain int keys keep Enum hashing out of the keypress dispatch path
+        self.callbacks[int(button_code)].append(callback)
+
+    def add_button_callbacks(self, mapping: Mapping[int, Callable]) -> None:
+        """
+        Add callbacks for several remote buttons at once.
+
+        Args:
+            mapping: Maps each button code to the callback for that button
+        """
+        callbacks = self.callbacks
+        for button_code, callback in mapping.items():
+            callbacks[int(button_code)].append(callback)
 
     def remove_button_callback(self, button_code: int, callback: Callable) -> None:
         """Remove a callback for a specific remote button press."""
+        button_code = int(button_code)
         if button_code in self.callbacks and callback in self.callbacks[button_code]:
             self.callbacks[button_code].remove(callback)
 
@@ -334,8 +537,6 @@ class CECAdapter:
             opcode: The CEC command opcode
             callback: Function to call when the command is received
         """
-        if opcode not in self.command_callbacks:
-            self.command_callbacks[opcode] = []
         self.command_callbacks[opcode].append(callback)
 
     def remove_command_callback(self, opcode: int, callback: Callable) -> None:
@@ -352,60 +553,152 @@ class CECAdapter:
         ):
             self.command_callbacks[opcode].remove(callback)
 
+    def _start_worker(self) -> None:
+        """Start the thread that dispatches queued CEC events."""
+        with self._worker_lock:
+            self._worker_running = True
+            if self._worker is not None:
+                # The previous worker has not exited yet; it stays the only
+                # consumer of the ring and simply keeps running
+                self._ring_ready.set()
+                return
+            self._worker = threading.Thread(
+                target=self._drain_events, name="cec-dispatch", daemon=True
+            )
+            self._worker.start()
+
+    def _stop_worker(self, timeout: float = 2.0) -> None:
+        """Let the dispatch thread drain pending events, then wait for it to exit."""
+        with self._worker_lock:
+            worker = self._worker
+            self._worker_running = False
+        if worker is None:
+            return
+        self._ring_ready.set()
+
+        # The worker clears self._worker itself once it has actually exited
+        if worker is not threading.current_thread():
+            worker.join(timeout=timeout)
+            if worker.is_alive():
+                log_debug(
+                    "CEC dispatch thread still running after %s seconds",
+                    timeout,
+                    level="WARNING",
+                )
+
+    def _enqueue_event(self, handler: Callable, args: tuple) -> None:
+        """
+        Producer side of the ring buffer, called on the libcec callback thread.
+        Never blocks: the event is dropped if the ring is full.
+        """
+        tail = self._ring_tail
+        next_tail = (tail + 1) & _RING_MASK
+        if next_tail == self._ring_head:
+            log_debug("CEC event buffer full, dropping event", level="WARNING")
+            return
+        self._ring[tail] = (handler, args)
+        self._ring_tail = next_tail
+
+        # Only wake the worker if it may be waiting
+        if not self._ring_ready.is_set():
+            self._ring_ready.set()
+
+    def _drain_events(self) -> None:
+        """Consumer side of the ring buffer: dispatch events in batches."""
+        ring = self._ring
+        ready = self._ring_ready
+
+        while True:
+            head = self._ring_head
+            if head == self._ring_tail:
+                if not self._worker_running:
+                    # Decide to exit under the lock so _start_worker cannot
+                    # revive this worker after it has committed to exiting
+                    with self._worker_lock:
+                        if not self._worker_running:
+                            self._worker = None
+                            return
+                    continue
+                # Re-check after clearing so a concurrent enqueue is not missed
+                ready.clear()
+                if head == self._ring_tail and self._worker_running:
+                    ready.wait()
+                continue
+
+            # Dispatch up to a batch of the events published so far
+            tail = self._ring_tail
+            for _ in range(_EVENT_BATCH_SIZE):
+                if head == tail:
+                    break
+                event = ring[head]
+                ring[head] = None
+                head = (head + 1) & _RING_MASK
+                self._ring_head = head
+                if event is None:  # slots between head and tail are always set
+                    continue
+                handler, args = event
+                try:
+                    handler(*args)
+                except Exception as e:
+                    log_debug("Error dispatching CEC event: %s", e, level="ERROR")
+
     def handle_keypress(self, key_code: int, duration: int) -> None:
         """
-        Handle a keypress event from CEC.
+        Queue a keypress event from CEC for dispatch.
 
         Args:
             key_code: The key code that was pressed
             duration: How long the key was pressed
         """
+        # Drop remote auto-repeat presses that arrive faster than we dispatch.
+        # Releases (non-zero duration) always pass through.
+        if duration == 0:
+            now = time.monotonic()
+            last = self._last_keypress.get(key_code)
+            if last is not None and now - last < self.config.key_repeat_interval:
+                return
+            self._last_keypress[key_code] = now
+
+        self._enqueue_event(self._dispatch_keypress, (key_code, duration))
+
+    def _dispatch_keypress(self, key_code: int, duration: int) -> None:
+        """Run the button callbacks registered for a keypress."""
         log_debug(
-            f"Received key: {key_code} (0x{key_code:02x}) duration: {duration}", "DEBUG"
+            "Received key: %d (0x%02x) duration: %d",
+            key_code,
+            key_code,
+            duration,
+            level="DEBUG",
         )
 
-        # First check for exact matches
-        if key_code in self.callbacks:
-            for callback in self.callbacks[key_code]:
-                try:
-                    callback(key_code, duration)
-                except Exception as e:
-                    log_debug(f"Error in button callback: {e}", "ERROR")
+        # Iterate over a snapshot so callbacks may add/remove callbacks
+        for callback in tuple(self.callbacks.get(key_code, ())):
+            try:
+                callback(key_code, duration)
+            except Exception as e:
+                log_debug("Error in button callback: %s", e, level="ERROR")
 
         # For debugging
-        button_names = {
-            RemoteButton.SELECT: "SELECT",
-            RemoteButton.UP: "UP",
-            RemoteButton.DOWN: "DOWN",
-            RemoteButton.LEFT: "LEFT",
-            RemoteButton.RIGHT: "RIGHT",
-            RemoteButton.BACK: "BACK",
-            RemoteButton.VOLUME_UP: "VOLUME_UP",
-            RemoteButton.VOLUME_DOWN: "VOLUME_DOWN",
-            RemoteButton.MUTE: "MUTE",
-            RemoteButton.PLAY: "PLAY",
-            RemoteButton.PAUSE: "PAUSE",
-            RemoteButton.STOP: "STOP",
-            RemoteButton.REWIND: "REWIND",
-            RemoteButton.FAST_FORWARD: "FAST_FORWARD",
-            RemoteButton.RED: "RED",
-            RemoteButton.GREEN: "GREEN",
-            RemoteButton.YELLOW: "YELLOW",
-            RemoteButton.BLUE: "BLUE",
-        }
-
-        button_name = button_names.get(key_code, f"UNKNOWN (0x{key_code:02x})")
-        log_debug(f"Remote button: {button_name}", "INFO")
+        if debug_mode:
+            try:
+                button_name = RemoteButton(key_code).name
+            except ValueError:
+                button_name = f"UNKNOWN (0x{key_code:02x})"
+            log_debug("Remote button: %s", button_name, level="INFO")
 
     def handle_command(self, cmd, *args) -> None:
         """
-        Handle a CEC command.
+        Queue a CEC command for dispatch.
 
         Args:
             cmd: The command
             *args: Additional arguments for the command
         """
-        log_debug(f"Received command: {cmd} args: {args}", "DEBUG")
+        self._enqueue_event(self._dispatch_command, (cmd,) + args)
+
+    def _dispatch_command(self, cmd, *args) -> None:
+        """Run the command callbacks registered for a CEC command."""
+        log_debug("Received command: %s args: %s", cmd, args, level="DEBUG")
 
         try:
             # Determine opcode and parameters based on command format
@@ -421,38 +714,40 @@ class CECAdapter:
                 opcode = args[2]
                 params = args[3] if len(args) > 3 else None
             else:
-                log_debug(f"Unknown command format: {cmd} {args}", "WARNING")
+                log_debug("Unknown command format: %s %s", cmd, args, level="WARNING")
                 return
 
             # Call matching command callbacks
-            if opcode in self.command_callbacks:
-                for callback in self.command_callbacks[opcode]:
-                    try:
-                        callback(cmd, *args)
-                    except Exception as e:
-                        log_debug(f"Error in command callback: {e}", "ERROR")
+            for callback in tuple(self.command_callbacks.get(opcode, ())):
+                try:
+                    callback(cmd, *args)
+                except Exception as e:
+                    log_debug("Error in command callback: %s", e, level="ERROR")
 
         except Exception as e:
-            log_debug(f"Error handling command: {e}", "ERROR")
+            log_debug("Error handling command: %s", e, level="ERROR")
 
     def register_event_handlers(self) -> None:
         """Register CEC event handlers."""
-        if hasattr(cec, "add_callback"):
+        add_callback = self._cec_add_callback
+        if add_callback is not None:
             # Register for key press events
-            cec.add_callback(self.handle_keypress, cec.EVENT_KEYPRESS)
+            add_callback(self.handle_keypress, self._event_keypress)
             # Register for command events
-            cec.add_callback(self.handle_command, cec.EVENT_COMMAND)
-            log_debug("CEC event handlers registered", "DEBUG")
+            add_callback(self.handle_command, self._event_command)
+            log_debug("CEC event handlers registered", level="DEBUG")
 
     def unregister_event_handlers(self) -> None:
         """Unregister CEC event handlers."""
-        if hasattr(cec, "remove_callback"):
+        remove_callback = self._cec_remove_callback
+        if remove_callback is not None:
             # Unregister key press events
-            cec.remove_callback(self.handle_keypress, cec.EVENT_KEYPRESS)
+            remove_callback(self.handle_keypress, self._event_keypress)
             # Unregister command events
-            cec.remove_callback(self.handle_command, cec.EVENT_COMMAND)
-            log_debug("CEC event handlers unregistered", "DEBUG")
+            remove_callback(self.handle_command, self._event_command)
+            log_debug("CEC event handlers unregistered", level="DEBUG")
 
+    @_require_init("send command", False)
     def send_command(
         self,
         opcode: int,
@@ -472,14 +767,13 @@ class CECAdapter:
         Returns:
             True if command sent successfully, False otherwise
         """
-        if not self.initialized:
-            log_debug("CEC not initialized, cannot send command", "ERROR")
-            return False
-
         log_debug(
-            f"Sending command {opcode} (0x{opcode:02x}) to {destination} "
-            f"with params: {parameters.hex() if parameters else 'none'}",
-            "DEBUG",
+            "Sending command %d (0x%02x) to %s with params: %s",
+            opcode,
+            opcode,
+            destination,
+            parameters.hex() if parameters else "none",
+            level="DEBUG",
         )
 
         try:
@@ -487,41 +781,42 @@ class CECAdapter:
             cec.transmit(destination, opcode, parameters)
             return True
         except Exception as e:
-            log_debug(f"Error sending command: {e}", "ERROR")
+            log_debug("Error sending command: %s", e, level="ERROR")
             return False
 
     def power_on_tv(self) -> bool:
         """Turn on the TV."""
-        log_debug("Sending POWER ON to TV", "INFO")
+        log_debug("Sending POWER ON to TV", level="INFO")
         return self.send_command(CECCommand.IMAGE_VIEW_ON)
 
     def standby_tv(self) -> bool:
         """Put the TV in standby mode."""
-        log_debug("Sending STANDBY to TV", "INFO")
+        log_debug("Sending STANDBY to TV", level="INFO")
         return self.send_command(CECCommand.STANDBY)
 
+    @_require_init("set active source", False)
     def set_active_source(self) -> bool:
         """Set this device as the active source."""
-        log_debug("Setting device as active source", "INFO")
+        log_debug("Setting device as active source", level="INFO")
 
         try:
             # Try the simple approach first
-            if hasattr(cec, "set_active_source"):
-                success = cec.set_active_source()
+            if self._cec_set_active_source is not None:
+                success = self._cec_set_active_source()
                 if success:
                     return True
 
             # Fall back to manual implementation
-            phys_addr = bytes.fromhex(self.config.physical_address.replace(".", ""))
             return self.send_command(
                 CECCommand.ACTIVE_SOURCE,
-                cec.CECDEVICE_BROADCAST,
-                phys_addr,
+                self._bcast_addr,
+                self.config.physical_address_bytes,
             )
         except Exception as e:
-            log_debug(f"Error setting active source: {e}", "ERROR")
+            log_debug("Error setting active source: %s", e, level="ERROR")
             return False
 
+    @_require_init("send remote button", False)
     def send_remote_button(
         self, button_code: int, pressed: bool = True, hold_time: float = 0.2
     ) -> bool:
@@ -536,35 +831,39 @@ class CECAdapter:
         Returns:
             True if successful, False otherwise
         """
-        if not self.initialized:
-            log_debug("CEC not initialized, cannot send remote button", "ERROR")
-            return False
+        # Button release
+        if not pressed:
+            return self._send_release(button_code)
 
         # Button press
-        if pressed:
-            opcode = CECCommand.USER_CONTROL_PRESSED
-            log_debug(
-                f"Sending BUTTON PRESS: {button_code} (0x{button_code:02x})", "INFO"
-            )
-            result = self.send_command(opcode, cec.CECDEVICE_TV, bytes([button_code]))
+        if not self._send_press(button_code):
+            return False
 
-            if not result:
-                return False
+        # If hold time is specified, wait and then send release
+        if hold_time > 0:
+            time.sleep(hold_time)
+            return self._send_release(button_code)
 
-            # If hold time is specified, wait and then send release
-            if hold_time > 0:
-                time.sleep(hold_time)
-                return self.send_remote_button(button_code, False)
+        return True
 
-            return True
+    def _send_press(self, button_code: int) -> bool:
+        """Send a USER_CONTROL_PRESSED frame for button_code to the TV."""
+        log_debug(
+            "Sending BUTTON PRESS: %d (0x%02x)", button_code, button_code, level="INFO"
+        )
+        return self.send_command(
+            CECCommand.USER_CONTROL_PRESSED, self._tv_addr, bytes([button_code])
+        )
 
-        # Button release
-        else:
-            opcode = CECCommand.USER_CONTROL_RELEASED
-            log_debug(
-                f"Sending BUTTON RELEASE: {button_code} (0x{button_code:02x})", "INFO"
-            )
-            return self.send_command(opcode, cec.CECDEVICE_TV)
+    def _send_release(self, button_code: int) -> bool:
+        """Send a USER_CONTROL_RELEASED frame to the TV."""
+        log_debug(
+            "Sending BUTTON RELEASE: %d (0x%02x)",
+            button_code,
+            button_code,
+            level="INFO",
+        )
+        return self.send_command(CECCommand.USER_CONTROL_RELEASED, self._tv_addr)
 
     def request_power_status(self) -> bool:
         """
@@ -573,7 +872,7 @@ class CECAdapter:
         Returns:
             True if request sent successfully, False otherwise
         """
-        log_debug("Requesting power status from TV", "INFO")
+        log_debug("Requesting power status from TV", level="INFO")
         return self.send_command(CECCommand.GIVE_DEVICE_POWER_STATUS)
 
     def request_vendor_id(self) -> bool:
@@ -583,9 +882,10 @@ class CECAdapter:
         Returns:
             True if request sent successfully, False otherwise
         """
-        log_debug("Requesting vendor ID from TV", "INFO")
+        log_debug("Requesting vendor ID from TV", level="INFO")
         return self.send_command(CECCommand.GIVE_DEVICE_VENDOR_ID)
 
+    @_require_init("run event loop", None)
     def run(self, max_duration: Optional[float] = None) -> None:
         """
         Run the adapter indefinitely or for a specified duration, waiting for CEC events.
@@ -594,36 +894,71 @@ class CECAdapter:
         Args:
             max_duration: Maximum time to run in seconds, or None to run indefinitely
         """
-        if not self.initialized:
-            log_debug("CEC not initialized, cannot run event loop", "ERROR")
-            return
-
-        log_debug("Starting CEC event loop...", "INFO")
-        start_time = time.time()
+        log_debug("Starting CEC event loop...", level="INFO")
+        self._stop_event.clear()
 
         try:
-            # Loop until interrupted or duration exceeded
-            while True:
-                # Check if we've exceeded max duration
-                if (
-                    max_duration is not None
-                    and time.time() - start_time >= max_duration
-                ):
-                    log_debug(
-                        f"CEC event loop reached maximum duration of {max_duration} seconds",
-                        "INFO",
-                    )
-                    break
-
-                # Sleep to prevent CPU hogging
-                time.sleep(0.1)
+            # Block until stop() is called or the duration expires
+            if not self._stop_event.wait(max_duration):
+                log_debug(
+                    "CEC event loop reached maximum duration of %s seconds",
+                    max_duration,
+                    level="INFO",
+                )
         except KeyboardInterrupt:
-            log_debug("CEC event loop interrupted by user", "INFO")
+            self._stop_event.set()
+            log_debug("CEC event loop interrupted by user", level="INFO")
         except Exception as e:
-            log_debug(f"Error in CEC event loop: {e}", "ERROR")
+            log_debug("Error in CEC event loop: %s", e, level="ERROR")
         finally:
-            log_debug("CEC event loop ended", "DEBUG")
+            log_debug("CEC event loop ended", level="DEBUG")
 
-    def __del__(self):
-        """Destructor to ensure resources are cleaned up."""
+    async def run_async(self, max_duration: Optional[float] = None) -> None:
+        """
+        Asyncio counterpart of run(): wait for CEC events without blocking the loop.
+        libcec delivers events on its own thread, so this only waits until stop() is
+        called, the duration expires or the task is cancelled.
+
+        Args:
+            max_duration: Maximum time to run in seconds, or None to run indefinitely
+        """
+        if not self.initialized:
+            log_debug("CEC not initialized, cannot run event loop", level="ERROR")
+            return
+
+        log_debug("Starting CEC event loop...", level="INFO")
+        self._stop_event.clear()
+        stopped = asyncio.Event()
+        self._async_stop = (asyncio.get_running_loop(), stopped)
+
+        try:
+            await asyncio.wait_for(stopped.wait(), max_duration)
+        except asyncio.TimeoutError:
+            log_debug(
+                "CEC event loop reached maximum duration of %s seconds",
+                max_duration,
+                level="INFO",
+            )
+        finally:
+            self._async_stop = None
+            log_debug("CEC event loop ended", level="DEBUG")
+
+    def stop(self) -> None:
+        """Stop a running event loop started with run() or run_async()."""
+        self._stop_event.set()
+
+        # stop() may be called from a CEC callback thread
+        waiter = self._async_stop
+        if waiter is not None:
+            loop, stopped = waiter
+            loop.call_soon_threadsafe(stopped.set)
+
+    def __enter__(self) -> "CECAdapter":
+        """Initialize the CEC connection for use in a with block."""
+        if not self.init():
+            raise RuntimeError("Failed to initialize CEC adapter")
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Clean up CEC resources when leaving the with block."""
         self.cleanup()
@@ -1,5 +1,20 @@
 #!/usr/bin/env python3
-"""
+import functools
+import sys
+from types import MappingProxyType, SimpleNamespace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+# Printed by --help; kept in a constant because python -OO strips docstrings
+_USAGE = """
 PiTVRemote - CEC adapter for Raspberry Pi.
 
 Usage:
@@ -10,111 +25,120 @@ Options:
   --duration SECONDS   Run for a specified number of seconds (default: run indefinitely)
   --help               Show this help message and exit
 """
-import argparse
-import datetime
-import sys
-import time
-import traceback
-from typing import Callable, Dict, Optional
-
-# Import from pi_tv_remote
-from pi_tv_remote.cec_adapter import log_debug  # Import the log_debug function
-from pi_tv_remote.cec_adapter import CECAdapter, CECConfig, RemoteButton
-
-
-def create_default_callbacks(adapter: CECAdapter) -> None:
-    """Create default callbacks for all standard buttons."""
-    log_debug("Setting up button callbacks", "DEBUG")
-    start_time = time.time()
-
-    def generic_handler(button_name: str, icon: str) -> Callable:
-        """Create a generic button handler."""
-
-        def handler(key_code: int, duration: int) -> None:
-            log_debug(f"{icon} {button_name} button pressed (code: {hex(key_code)})")
-
-        return handler
-
-    # Map buttons to handler names and icons
-    button_info = {
-        RemoteButton.UP: ("UP", "⬆️"),
-        RemoteButton.DOWN: ("DOWN", "⬇️"),
-        RemoteButton.LEFT: ("LEFT", "⬅️"),
-        RemoteButton.RIGHT: ("RIGHT", "➡️"),
-        RemoteButton.SELECT: ("SELECT", "⏺️"),
-        RemoteButton.BACK: ("BACK", "🔙"),
-        RemoteButton.STOP: ("STOP", "⏹️"),
-        RemoteButton.PLAY: ("PLAY", "▶️"),
-        RemoteButton.PAUSE: ("PAUSE", "⏸️"),
-        RemoteButton.REWIND: ("REWIND", "⏪"),
-        RemoteButton.FAST_FORWARD: ("FAST_FORWARD", "⏩"),
-        RemoteButton.BLUE: ("BLUE", "🔵"),
-        RemoteButton.RED: ("RED", "🔴"),
-        RemoteButton.GREEN: ("GREEN", "🟢"),
-        RemoteButton.YELLOW: ("YELLOW", "🟡"),
-        # Volume controls
-        RemoteButton.VOLUME_UP: ("VOLUME_UP", "🔊"),
-        RemoteButton.VOLUME_DOWN: ("VOLUME_DOWN", "🔉"),
-        RemoteButton.MUTE: ("MUTE", "🔇"),
-        # Number keys
-        RemoteButton.NUMBER_0: ("0", "0️⃣"),
-        RemoteButton.NUMBER_1: ("1", "1️⃣"),
-        RemoteButton.NUMBER_2: ("2", "2️⃣"),
-        RemoteButton.NUMBER_3: ("3", "3️⃣"),
-        RemoteButton.NUMBER_4: ("4", "4️⃣"),
-        RemoteButton.NUMBER_5: ("5", "5️⃣"),
-        RemoteButton.NUMBER_6: ("6", "6️⃣"),
-        RemoteButton.NUMBER_7: ("7", "7️⃣"),
-        RemoteButton.NUMBER_8: ("8", "8️⃣"),
-        RemoteButton.NUMBER_9: ("9", "9️⃣"),
-    }
-
-    # Create handlers for each button
-    for button_code, (button_name, icon) in button_info.items():
-        adapter.add_button_callback(button_code, generic_handler(button_name, icon))
-
-    log_debug(
-        f"Button callbacks setup completed in {time.time() - start_time:.2f} seconds",
-        "DEBUG",
+__doc__ = _USAGE
+
+# The CEC stack is imported lazily so that --help does not pay for it
+if TYPE_CHECKING:
+    import argparse
+
+    from pi_tv_remote.cec_adapter import CECAdapter, CECConfig
+
+# Default button handlers: (RemoteButton member, display name, icon)
+_BUTTON_INFO: Tuple[Tuple[str, str, str], ...] = (
+    ("UP", "UP", "⬆️"),
+    ("DOWN", "DOWN", "⬇️"),
+    ("LEFT", "LEFT", "⬅️"),
+    ("RIGHT", "RIGHT", "➡️"),
+    ("SELECT", "SELECT", "⏺️"),
+    ("BACK", "BACK", "🔙"),
+    ("STOP", "STOP", "⏹️"),
+    ("PLAY", "PLAY", "▶️"),
+    ("PAUSE", "PAUSE", "⏸️"),
+    ("REWIND", "REWIND", "⏪"),
+    ("FAST_FORWARD", "FAST_FORWARD", "⏩"),
+    ("BLUE", "BLUE", "🔵"),
+    ("RED", "RED", "🔴"),
+    ("GREEN", "GREEN", "🟢"),
+    ("YELLOW", "YELLOW", "🟡"),
+    # Volume controls
+    ("VOLUME_UP", "VOLUME_UP", "🔊"),
+    ("VOLUME_DOWN", "VOLUME_DOWN", "🔉"),
+    ("MUTE", "MUTE", "🔇"),
+    # Number keys
+    ("NUMBER_0", "0", "0️⃣"),
+    ("NUMBER_1", "1", "1️⃣"),
+    ("NUMBER_2", "2", "2️⃣"),
+    ("NUMBER_3", "3", "3️⃣"),
+    ("NUMBER_4", "4", "4️⃣"),
+    ("NUMBER_5", "5", "5️⃣"),
+    ("NUMBER_6", "6", "6️⃣"),
+    ("NUMBER_7", "7", "7️⃣"),
+    ("NUMBER_8", "8", "8️⃣"),
+    ("NUMBER_9", "9", "9️⃣"),
+)
+
+
+def _make_handler(button_name: str, icon: str) -> Callable[[int, int], None]:
+    """Create a handler that logs presses of the given button."""
+    # CECAdapter rebinds cec_adapter.log_debug to a no-op when debug is off;
+    # the cached handlers keep the guarded version, which checks debug_mode
+    from pi_tv_remote.cec_adapter import _log_debug as log_debug
+
+    # The invariant part of the message is formatted once, up front
+    prefix = f"{icon} {button_name} button pressed (code: 0x"
+
+    def handler(key_code: int, duration: int) -> None:
+        log_debug("%s%x)", prefix, key_code)
+
+    return handler
+
+
+@functools.lru_cache(maxsize=None)
+def _default_handlers() -> Mapping[int, Callable[[int, int], None]]:
+    """Create the default handlers once; they are shared by every adapter."""
+    from pi_tv_remote.cec_adapter import RemoteButton
+
+    return MappingProxyType(
+        {
+            int(RemoteButton[member]): _make_handler(name, icon)
+            for member, name, icon in _BUTTON_INFO
+        }
     )
 
 
-def run_cec_adapter(config: CECConfig, duration: Optional[int] = None) -> None:
-    """Run the CEC adapter for the specified duration or indefinitely."""
-    adapter = CECAdapter(config)
+def create_default_callbacks(adapter: "CECAdapter") -> None:
+    """Register the default callbacks for all standard buttons."""
+    adapter.add_button_callbacks(_default_handlers())
 
-    log_debug(f"Initializing CEC adapter...", "INFO")
-    log_debug(f"Device name: {config.device_name}", "DEBUG")
-    log_debug(f"Physical address: {config.physical_address}", "DEBUG")
-
-    # Initialize the adapter
-    if not adapter.init():
-        log_debug("Failed to initialize CEC adapter", "ERROR")
-        return
-
-    # Register default button callbacks
-    log_debug("Registering button callbacks", "DEBUG")
-    create_default_callbacks(adapter)
-
-    try:
-        # Run indefinitely
-        log_debug("Starting CEC event loop to run indefinitely", "INFO")
-        adapter.run()
-
-    except KeyboardInterrupt:
-        log_debug("\nKeyboard interrupt received, exiting...", "INFO")
-        print("\nExiting...")
-    except Exception as e:
-        log_debug(f"Error in main execution: {e}", "ERROR")
-        log_debug(f"Traceback: {traceback.format_exc()}", "ERROR")
-        print(f"Error: {e}")
-    finally:
-        log_debug("Closing CEC adapter", "DEBUG")
-        adapter.cleanup()
 
+async def run_cec_adapter(config: "CECConfig", duration: Optional[int] = None) -> None:
+    """Run the CEC adapter for the specified duration or indefinitely."""
+    from pi_tv_remote.cec_adapter import CECAdapter, log_debug
+
+    log_debug("Initializing CEC adapter...", level="INFO")
+    log_debug("Device name: %s", config.device_name, level="DEBUG")
+    log_debug("Physical address: %s", config.physical_address, level="DEBUG")
+
+    # The adapter is initialized on entry (RuntimeError if that fails) and
+    # cleaned up on exit
+    with CECAdapter(config) as adapter:
+        # Register default button callbacks
+        log_debug("Registering button callbacks", level="DEBUG")
+        create_default_callbacks(adapter)
+
+        try:
+            if duration is None:
+                log_debug("Starting CEC event loop to run indefinitely", level="INFO")
+            else:
+                log_debug(
+                    "Starting CEC event loop for %s seconds", duration, level="INFO"
+                )
+            await adapter.run_async(duration)
+
+        except Exception as e:
+            import traceback
+
+            log_debug("Error in main execution: %s", e, level="ERROR")
+            log_debug("Traceback: %s", traceback.format_exc(), level="ERROR")
+            print(f"Error: {e}")
+        finally:
+            log_debug("Closing CEC adapter", level="DEBUG")
+
+
+def _parse_args_argparse(argv: List[str]) -> "argparse.Namespace":
+    """Parse arguments with argparse, which reports errors for bad input."""
+    import argparse
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="CEC adapter for Raspberry Pi")
 
     parser.add_argument(
@@ -130,7 +154,48 @@ def parse_args() -> argparse.Namespace:
         default=None,
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> SimpleNamespace:
+    """
+    Parse command line arguments.
+
+    Only --name, --duration and --help are handled here. Anything else is
+    passed to argparse so that it reports the usual usage errors.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    name = "RaspberryPi"
+    duration: Optional[int] = None
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-h", "--help"):
+            print(_USAGE.strip())
+            sys.exit(0)
+
+        option, sep, value = arg.partition("=")
+        if option not in ("--name", "--duration"):
+            return SimpleNamespace(**vars(_parse_args_argparse(argv)))
+        if not sep:
+            i += 1
+            if i == len(argv) or argv[i].startswith("--"):
+                return SimpleNamespace(**vars(_parse_args_argparse(argv)))
+            value = argv[i]
+
+        if option == "--name":
+            name = value
+        else:
+            try:
+                duration = int(value)
+            except ValueError:
+                return SimpleNamespace(**vars(_parse_args_argparse(argv)))
+        i += 1
+
+    return SimpleNamespace(name=name, duration=duration)
 
 
 def main() -> None:
@@ -142,16 +207,32 @@ def main() -> None:
     print(" PiTVRemote - CEC Adapter for Raspberry Pi")
     print("=" * 40)
 
+    # Only load the CEC stack once the arguments are known to be valid
+    from pi_tv_remote.cec_adapter import CECConfig
+
     # Create configuration
     config = CECConfig(
         device_name=args.name,
     )
 
-    # Run the adapter
+    # Run the adapter on uvloop when it is available (the "uvloop" extra)
+    runner: Callable[[Coroutine[Any, Any, None]], None]
+    try:
+        import uvloop
+
+        runner = uvloop.run
+    except (ImportError, AttributeError):  # uvloop.run needs uvloop >= 0.18
+        import asyncio
+
+        runner = asyncio.run
+
+    # Ctrl-C cancels the adapter task; the runner then raises KeyboardInterrupt
     try:
-        run_cec_adapter(config, args.duration)
+        runner(run_cec_adapter(config, args.duration))
     except KeyboardInterrupt:
         print("\nInterrupted by user. Exiting.")
+    except RuntimeError as e:
+        print(f"Error: {e}")
 
     print("\nExiting PiTVRemote.")
 
@@ -2,54 +2,80 @@
 """
 PiTVRemote - CEC Adapter for Raspberry Pi
 Requires Raspberry Pi hardware with HDMI-CEC support and the python-cec package.
+
+Project metadata lives in pyproject.toml; this file only adds the commands
+that install the system libcec dependencies on a Raspberry Pi.
 """
-import os
+import functools
 import platform
 import subprocess
 import sys
 
-from setuptools import Command, find_packages, setup
+from setuptools import Command, setup
 from setuptools.command.develop import develop
 from setuptools.command.install import install
 
-# Check if we're on Raspberry Pi
-is_raspberry_pi = (
-    platform.system() == "Linux"
-    and os.path.exists("/proc/device-tree/model")
-    and "raspberry pi" in open("/proc/device-tree/model").read().lower()
-    if os.path.exists("/proc/device-tree/model")
-    else False
+
+@functools.lru_cache(maxsize=None)
+def _is_rpi():
+    """Check if we're on Raspberry Pi (cached after first call)."""
+    if platform.system() != "Linux":
+        return False
+    try:
+        # The device-tree model is a NUL-terminated string; no need to decode it
+        with open("/proc/device-tree/model", "rb") as f:
+            return b"raspberry pi" in f.read().lower()
+    except OSError:
+        return False
+
+
+# System packages needed for libcec and the python3-cec bindings
+_APT_PACKAGES = (
+    "libcec6",
+    "libcec-dev",
+    "python3-cec",
+    "build-essential",
+    "python3-dev",
+    "python3-pip",
 )
 
-# Define package requirements for Raspberry Pi
-requirements = ["pydantic>=2.0.0"]
-package_name = "pi_tv_remote"
+
+def _apt_packages_installed(packages):
+    """Check with dpkg-query whether all the given packages are installed."""
+    try:
+        result = subprocess.run(
+            ["dpkg-query", "-W", "-f=${Status}\n", *packages],
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return False
+
+    # dpkg-query exits non-zero if any package is unknown
+    statuses = result.stdout.splitlines()
+    return (
+        result.returncode == 0
+        and len(statuses) == len(packages)
+        and all(status.endswith("install ok installed") for status in statuses)
+    )
 
 
 def install_libcec_dependencies():
     """Install the libcec dependencies for Raspberry Pi."""
     # Only run on actual Raspberry Pi hardware
-    if not is_raspberry_pi:
+    if not _is_rpi():
         print("Not on Raspberry Pi - skipping system dependency installation")
         return
 
+    # Skip apt entirely (including the slow "apt-get update") when provisioned
+    if _apt_packages_installed(_APT_PACKAGES):
+        print("libcec dependencies already installed - skipping apt-get")
+        return
+
     try:
         print("\nInstalling libcec dependencies for Raspberry Pi...")
         subprocess.check_call(["sudo", "apt-get", "update"])
-        subprocess.check_call(
-            [
-                "sudo",
-                "apt-get",
-                "install",
-                "-y",
-                "libcec6",
-                "libcec-dev",
-                "python3-cec",
-                "build-essential",
-                "python3-dev",
-                "python3-pip",
-            ]
-        )
+        subprocess.check_call(["sudo", "apt-get", "install", "-y", *_APT_PACKAGES])
     except subprocess.CalledProcessError as e:
         print(f"Error installing dependencies: {e}")
         sys.exit(1)
@@ -58,7 +84,7 @@ def install_libcec_dependencies():
 def install_cec_module():
     """Install the Python CEC module using pip."""
     # Only run on actual Raspberry Pi hardware
-    if not is_raspberry_pi:
+    if not _is_rpi():
         print("Not on Raspberry Pi - skipping CEC module installation")
         return
 
@@ -104,51 +130,13 @@ class CustomDevelop(develop):
         develop.run(self)
 
 
-# Create the setup configuration
+# Metadata, dependencies and entry points come from pyproject.toml
+# The package is intentionally not Cython-compiled: pydantic rejects the compiled
+# methods on CECConfig, and a compiled cli breaks ``python -m pi_tv_remote.cli``
 setup(
-    name=package_name,
-    version="0.1.0",
-    description="CEC Adapter for Raspberry Pi - Requires HDMI-CEC hardware",
-    long_description=open("README.md").read(),
-    long_description_content_type="text/markdown",
-    author="Your Name",
-    author_email="your.email@example.com",
-    url="https://github.com/yourusername/pi_tv_remote",
-    packages=find_packages(),
-    install_requires=requirements,
-    extras_require={
-        "dev": [
-            "pytest",
-            "mypy",
-            "black",
-            "isort",
-        ],
-    },
     cmdclass={
         "preinstall": PreInstallCommand,
         "install": CustomInstall,
         "develop": CustomDevelop,
     },
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Topic :: Software Development :: Libraries",
-        "Topic :: Home Automation",
-        "Environment :: Console",
-        "Operating System :: POSIX :: Linux",
-        "Intended Audience :: End Users/Desktop",
-    ],
-    python_requires=">=3.7",
-    entry_points={
-        "console_scripts": [
-            "pi_tv_remote=pi_tv_remote:main",
-        ],
-    },
 )
@@ -0,0 +1,25 @@
+"""
+Shared pytest configuration for the Pi TV Remote tests.
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Fall back to the stub cec module when python-cec is not installed, so the
+# tests can be collected without CEC hardware (the real TV tests then skip)
+sys.path.append(os.path.join(os.path.dirname(__file__), "stubs"))
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default loop
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
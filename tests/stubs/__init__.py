@@ -0,0 +1 @@
+"""Stand-in modules for running the tests without CEC hardware."""
@@ -0,0 +1,47 @@
+"""
+Minimal stand-in for the python-cec module.
+
+It records transmitted frames and registered callbacks instead of talking to
+a CEC adapter. init() fails unless ``connected`` is set, so the real TV tests
+skip rather than pass against this stub.
+"""
+from typing import Callable, List, Tuple
+
+CECDEVICE_TV = 0
+CECDEVICE_BROADCAST = 15
+
+EVENT_KEYPRESS = 0x02
+EVENT_COMMAND = 0x04
+
+# Set by tests that want init() to succeed
+connected = False
+
+# (callback, event) pairs registered with add_callback()
+callbacks: List[Tuple[Callable, int]] = []
+# (destination, opcode, parameters) for every transmit() call
+sent: List[Tuple[int, int, bytes]] = []
+
+
+def init() -> None:
+    """Pretend to open the default CEC adapter."""
+    if not connected:
+        raise OSError("No CEC adapter found (stub cec module)")
+
+
+def close() -> None:
+    """Pretend to close the CEC adapter."""
+
+
+def add_callback(callback: Callable, event: int) -> None:
+    """Register a callback for a CEC event."""
+    callbacks.append((callback, event))
+
+
+def remove_callback(callback: Callable, event: int) -> None:
+    """Unregister a callback for a CEC event."""
+    callbacks.remove((callback, event))
+
+
+def transmit(destination: int, opcode: int, parameters: bytes = b"") -> None:
+    """Record a CEC frame instead of sending it."""
+    sent.append((destination, opcode, parameters))
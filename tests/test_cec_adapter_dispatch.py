@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+CEC Adapter Dispatch Tests
+This pytest module tests the event ring buffer, the dispatch worker and the
+key repeat throttle against the stub cec module, so no hardware is needed.
+"""
+import functools
+import sys
+import threading
+from typing import List, Tuple
+
+import pytest
+
+import pi_tv_remote.cec_adapter as cec_adapter
+from pi_tv_remote.cec_adapter import _RING_SIZE, CECAdapter, CECConfig
+from tests.stubs import cec as stub_cec
+
+# Key code used for the queued events (RemoteButton.SELECT)
+_KEY = 0x00
+
+
+def _dispatch_threads() -> List[threading.Thread]:
+    """Return the dispatch worker threads that are still alive."""
+    return [t for t in threading.enumerate() if t.name == "cec-dispatch"]
+
+
+class _Recorder:
+    """Button callback that records events and can hold the dispatch worker."""
+
+    def __init__(self, block: bool = False):
+        self.events: List[Tuple[int, int]] = []
+        # Set once the first event is being dispatched
+        self.started = threading.Event()
+        # The first dispatched event waits for this before returning
+        self.gate = threading.Event()
+        if not block:
+            self.gate.set()
+
+    def __call__(self, key_code: int, duration: int) -> None:
+        self.started.set()
+        self.gate.wait(timeout=5)
+        self.events.append((key_code, duration))
+
+
+# Fixture for the stub cec module
+@pytest.fixture
+def fake_cec(monkeypatch):
+    """Route the adapter's cec calls to a freshly reset stub module."""
+    monkeypatch.setitem(sys.modules, "cec", stub_cec)
+    monkeypatch.setattr(cec_adapter, "cec", stub_cec)
+    monkeypatch.setattr(stub_cec, "connected", True)
+    monkeypatch.setattr(stub_cec, "callbacks", [])
+    monkeypatch.setattr(stub_cec, "sent", [])
+    return stub_cec
+
+
+# Fixture for a CEC adapter bound to the stub cec module
+@pytest.fixture
+def adapter(fake_cec):
+    """Create and initialize a CEC adapter without key repeat throttling."""
+    adapter = CECAdapter(CECConfig(key_repeat_interval=0))
+    assert adapter.init()
+
+    yield adapter
+
+    adapter.cleanup()
+
+
+def test_init_registers_event_handlers(adapter, fake_cec):
+    """Test that init() registers the keypress and command handlers."""
+    assert (adapter.handle_keypress, fake_cec.EVENT_KEYPRESS) in fake_cec.callbacks
+    assert (adapter.handle_command, fake_cec.EVENT_COMMAND) in fake_cec.callbacks
+
+
+def test_events_dispatched_in_order_and_drained_on_cleanup(adapter):
+    """Test that cleanup() dispatches every queued event, in order."""
+    recorder = _Recorder(block=True)
+    adapter.add_button_callback(_KEY, recorder)
+
+    # Queue events while the worker is held on the first one
+    for duration in range(200):
+        adapter.handle_keypress(_KEY, duration)
+    assert recorder.started.wait(timeout=5)
+
+    # Release the worker shortly after cleanup() starts waiting for it
+    threading.Timer(0.05, recorder.gate.set).start()
+    adapter.cleanup()
+
+    assert recorder.events == [(_KEY, duration) for duration in range(200)]
+    assert not _dispatch_threads()
+
+
+def test_events_dropped_when_ring_is_full(adapter):
+    """Test that a full ring drops new events instead of blocking."""
+    recorder = _Recorder(block=True)
+    adapter.add_button_callback(_KEY, recorder)
+
+    # The worker takes the first event off the ring, leaving it empty
+    adapter.handle_keypress(_KEY, 0)
+    assert recorder.started.wait(timeout=5)
+
+    # One slot always stays free to tell a full ring from an empty one
+    for duration in range(1, _RING_SIZE + 10):
+        adapter.handle_keypress(_KEY, duration)
+
+    recorder.gate.set()
+    adapter.cleanup()
+
+    assert recorder.events == [(_KEY, duration) for duration in range(_RING_SIZE)]
+
+
+def test_restart_while_worker_is_busy(adapter):
+    """Test that init() after cleanup() reuses a worker that is still busy."""
+    recorder = _Recorder(block=True)
+    adapter.add_button_callback(_KEY, recorder)
+
+    # Give up waiting for the held worker quickly
+    adapter._stop_worker = functools.partial(adapter._stop_worker, timeout=0.05)
+
+    adapter.handle_keypress(_KEY, 1)
+    assert recorder.started.wait(timeout=5)
+
+    # cleanup() returns while the worker is still dispatching
+    adapter.cleanup()
+    busy_worker = adapter._worker
+    assert busy_worker is not None and busy_worker.is_alive()
+
+    # The new session keeps the busy worker as the only consumer
+    assert adapter.init()
+    assert adapter._worker is busy_worker
+    assert _dispatch_threads() == [busy_worker]
+
+    adapter.handle_keypress(_KEY, 2)
+    recorder.gate.set()
+    del adapter._stop_worker
+    adapter.cleanup()
+
+    assert recorder.events == [(_KEY, 1), (_KEY, 2)]
+    assert not busy_worker.is_alive()
+    assert not _dispatch_threads()
+
+
+def test_repeated_presses_are_throttled(adapter):
+    """Test that auto-repeat presses are dropped within key_repeat_interval."""
+    recorder = _Recorder()
+    adapter.add_button_callback(_KEY, recorder)
+    adapter.add_button_callback(_KEY + 1, recorder)
+    adapter.config.key_repeat_interval = 60
+
+    adapter.handle_keypress(_KEY, 0)
+    adapter.handle_keypress(_KEY, 0)  # auto-repeat, dropped
+    adapter.handle_keypress(_KEY + 1, 0)  # another key, not throttled
+    adapter.handle_keypress(_KEY, 500)  # releases always pass through
+    adapter.cleanup()
+
+    assert recorder.events == [(_KEY, 0), (_KEY + 1, 0), (_KEY, 500)]
+
+
+def test_throttle_disabled_with_zero_interval(adapter):
+    """Test that a key_repeat_interval of 0 dispatches every press."""
+    recorder = _Recorder()
+    adapter.add_button_callback(_KEY, recorder)
+
+    for _ in range(3):
+        adapter.handle_keypress(_KEY, 0)
+    adapter.cleanup()
+
+    assert recorder.events == [(_KEY, 0)] * 3
@@ -3,12 +3,15 @@
 Test CEC Adapter with Real TV
 This pytest module tests the CECAdapter class with real TV hardware.
 """
+import asyncio
+import functools
 import os
 import sys
-import time
+from dataclasses import dataclass, field
 from typing import Optional
 
 import pytest
+import pytest_asyncio
 
 # Try to import from different locations
 try:
@@ -17,6 +20,7 @@ try:
         CECCommand,
         CECConfig,
         RemoteButton,
+        cec,
         log_debug,
     )
 except ImportError:
@@ -28,6 +32,7 @@ except ImportError:
             CECCommand,
             CECConfig,
             RemoteButton,
+            cec,
             log_debug,
         )
     except ImportError:
@@ -37,47 +42,82 @@ except ImportError:
         )
         raise
 
-# Store the TV's power status for tests
-tv_power_status: Optional[int] = None
+
+# Power status names, indexed by the REPORT_POWER_STATUS value
+_POWER_TEXT = ("on", "standby", "in transition to on", "in transition to standby")
+
+# Opcode of the TV's reply to a power status request (0x90)
+_REPORT_POWER_STATUS = int(CECCommand.REPORT_POWER_STATUS)
+
+
+@dataclass
+class TVState:
+    """The TV's power status, as reported to a single test's adapter."""
+
+    loop: asyncio.AbstractEventLoop
+    power: Optional[int] = None
+    # Set (on the test's event loop) whenever a power status report arrives
+    event: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+def _decode_command(cmd, args):
+    """Return (opcode, params) for a CEC command in any known format, or None."""
+    if cmd == 4 and args and isinstance(args[0], dict):
+        # Format 4 with dict in args[0], as python-cec delivers on real hardware
+        return args[0].get("opcode"), args[0].get("parameters")
+    if hasattr(cmd, "opcode"):
+        # Object format with opcode and parameters attributes
+        return cmd.opcode, getattr(cmd, "parameters", None)
+    if len(args) >= 3:
+        # Classic format with source, dest, opcode, params in args
+        return args[2], args[3] if len(args) > 3 else None
+    return None
 
 
 # Callback to capture TV power status responses
-def tv_power_status_callback(cmd, *args):
+def tv_power_status_callback(state: TVState, cmd, *args):
     """Callback for TV power status responses"""
-    global tv_power_status
+    # Registered directly with cec, so this sees every command on the bus
+    decoded = _decode_command(cmd, args)
+    if decoded is None or decoded[0] != _REPORT_POWER_STATUS:
+        return
 
     try:
-        # Try to extract power status from different formats
-        if hasattr(cmd, "parameters") and cmd.parameters:
-            # New format with parameters attribute
-            tv_power_status = cmd.parameters[0] if cmd.parameters else None
-        elif len(args) > 3 and args[3]:
-            # Old format with parameters in args[3]
-            tv_power_status = args[3][0] if args[3] else None
+        params = decoded[1]
+        state.power = params[0] if params else None
 
         # Log the status
-        status_text = "unknown"
-        if tv_power_status == 0:
-            status_text = "on"
-        elif tv_power_status == 1:
-            status_text = "standby"
-        elif tv_power_status == 2:
-            status_text = "in transition to on"
-        elif tv_power_status == 3:
-            status_text = "in transition to standby"
-
-        print(f"TV power status: {status_text} (0x{tv_power_status:02x})")
+        if isinstance(state.power, int) and 0 <= state.power < 4:
+            status_text = _POWER_TEXT[state.power]
+            print(f"TV power status: {status_text} (0x{state.power:02x})")
+        else:
+            print(f"TV power status: unknown ({state.power!r})")
     except Exception as e:
         print(f"Error in power status callback: {e}")
 
+    # Callbacks run on the libcec callback thread, not the event loop
+    state.loop.call_soon_threadsafe(state.event.set)
+
+
+async def wait_for_power_status(state: TVState, timeout: float = 3.0) -> None:
+    """Wait for the next TV power status report, giving up after timeout."""
+    try:
+        await asyncio.wait_for(state.event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        print("No power status report received from TV")
+
+
+# Fixture for the TV state seen by a single test
+@pytest_asyncio.fixture
+async def tv_state():
+    """Create a fresh TV state bound to the test's event loop."""
+    return TVState(loop=asyncio.get_running_loop())
+
 
 # Fixture for the CEC adapter
-@pytest.fixture
-def cec_adapter():
+@pytest_asyncio.fixture
+async def cec_adapter(tv_state):
     """Create and initialize a CEC adapter for testing."""
-    # Reset the global TV power status
-    global tv_power_status
-    tv_power_status = None
 
     # Create the adapter with default config
     adapter = CECAdapter()
@@ -86,45 +126,53 @@ def cec_adapter():
     if not adapter.init():
         pytest.skip("Failed to initialize CEC adapter - is a TV connected?")
 
-    # Register for power status reports
-    adapter.add_command_callback(
-        CECCommand.REPORT_POWER_STATUS, tv_power_status_callback
-    )
+    # The adapter cannot decode the format-4 commands real hardware sends, so
+    # watch for power status reports with a direct cec callback
+    power_status_callback = functools.partial(tv_power_status_callback, tv_state)
+    event_command = cec.EVENT_COMMAND
+    if hasattr(cec, "add_callback"):
+        cec.add_callback(power_status_callback, event_command)
 
     # Yield the adapter for testing
     yield adapter
 
+    if hasattr(cec, "remove_callback"):
+        cec.remove_callback(power_status_callback, event_command)
+
     # Clean up after the tests
     adapter.cleanup()
 
 
-def test_cec_initialization(cec_adapter):
+@pytest.mark.asyncio
+async def test_cec_initialization(cec_adapter):
     """Test that the CEC adapter initializes correctly."""
     assert cec_adapter.initialized
 
 
-def test_power_on_tv(cec_adapter):
+@pytest.mark.asyncio
+async def test_power_on_tv(cec_adapter, tv_state):
     """Test turning on the TV."""
     # Check current TV power status
     print("Checking TV power status...")
+    tv_state.event.clear()
     status_result = cec_adapter.request_power_status()
     assert status_result, "Failed to request TV power status"
 
     # Wait for response and check if TV is already on
-    time.sleep(2)
+    await wait_for_power_status(tv_state)
 
-    if tv_power_status == 0:  # TV is already on
+    if tv_state.power == 0:  # TV is already on
         print("TV is already powered on, skipping power on command")
     else:
         # Power on the TV
-        print(f"TV status is {tv_power_status}, sending power on command...")
+        print(f"TV status is {tv_state.power}, sending power on command...")
         try:
             result = cec_adapter.power_on_tv()
             assert result, "Failed to power on TV"
             print("Power on command sent successfully")
 
             # Give the TV time to turn on
-            time.sleep(3)
+            await asyncio.sleep(3)
         except Exception as e:
             print(f"Warning: Error during power on: {e}")
 
@@ -139,26 +187,29 @@ def test_power_on_tv(cec_adapter):
         # Continue with test even if this fails
 
 
-def test_set_active_source(cec_adapter):
+@pytest.mark.asyncio
+async def test_set_active_source(cec_adapter):
     """Test setting the device as the active source."""
     # Set as active source
     result = cec_adapter.set_active_source()
     assert result, "Failed to set as active source"
 
 
-def test_volume_control(cec_adapter):
+@pytest.mark.asyncio
+async def test_volume_control(cec_adapter):
     """Test volume control."""
     # Send volume up
     result = cec_adapter.send_remote_button(RemoteButton.VOLUME_UP)
     assert result, "Failed to send volume up command"
-    time.sleep(1)
+    await asyncio.sleep(1)
 
     # Send volume down
     result = cec_adapter.send_remote_button(RemoteButton.VOLUME_DOWN)
     assert result, "Failed to send volume down command"
 
 
-def test_send_command(cec_adapter):
+@pytest.mark.asyncio
+async def test_send_command(cec_adapter):
     """Test sending a direct CEC command."""
     # Send a direct command (GIVE_DEVICE_POWER_STATUS)
     result = cec_adapter.send_command(
@@ -167,23 +218,25 @@ def test_send_command(cec_adapter):
     assert result, "Failed to send direct command"
 
 
-def test_remote_button_press(cec_adapter):
+@pytest.mark.asyncio
+async def test_remote_button_press(cec_adapter):
     """Test sending a remote button press."""
     # Send a button press (UP button)
     result = cec_adapter.send_remote_button(RemoteButton.UP)
     assert result, "Failed to send remote button press"
-    time.sleep(1)
+    await asyncio.sleep(1)
 
 
 @pytest.mark.standby
-def test_standby_tv(cec_adapter):
+@pytest.mark.asyncio
+async def test_standby_tv(cec_adapter):
     """Test putting the TV in standby mode."""
     # This test is marked with 'standby' so it can be skipped if needed
 
     # Send standby command
     result = cec_adapter.standby_tv()
     assert result, "Failed to put TV in standby"
-    time.sleep(2)  # Give the TV time to go into standby
+    await asyncio.sleep(2)  # Give the TV time to go into standby
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+CLI Tests
+This pytest module tests the command line parsing of pi_tv_remote.cli.
+"""
+import subprocess
+import sys
+
+import pytest
+
+from pi_tv_remote.cli import parse_args
+
+
+def test_defaults():
+    """Test the defaults when no options are given."""
+    args = parse_args([])
+    assert args.name == "RaspberryPi"
+    assert args.duration is None
+
+
+def test_options_with_equals():
+    """Test options given as --option=value."""
+    args = parse_args(["--name=Living Room", "--duration=30"])
+    assert args.name == "Living Room"
+    assert args.duration == 30
+
+
+def test_options_with_separate_value():
+    """Test options given as --option value."""
+    args = parse_args(["--name", "Bedroom", "--duration", "5"])
+    assert args.name == "Bedroom"
+    assert args.duration == 5
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--name", "--duration", "5"],  # option taken as a value
+        ["--duration"],  # missing value
+        ["--duration", "soon"],  # not an integer
+        ["--unknown"],  # unsupported option
+    ],
+)
+def test_bad_input_falls_back_to_argparse(argv, capsys):
+    """Test that bad input is reported by argparse with a usage error."""
+    with pytest.raises(SystemExit) as excinfo:
+        parse_args(argv)
+    assert excinfo.value.code == 2
+    assert "usage:" in capsys.readouterr().err
+
+
+def test_help(capsys):
+    """Test that --help prints the usage text and exits cleanly."""
+    with pytest.raises(SystemExit) as excinfo:
+        parse_args(["--help"])
+    assert excinfo.value.code == 0
+    assert "--duration SECONDS" in capsys.readouterr().out
+
+
+def test_help_without_docstrings():
+    """Test that --help still works under python -OO, which strips docstrings."""
+    result = subprocess.run(
+        [sys.executable, "-OO", "-m", "pi_tv_remote.cli", "--help"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "--duration SECONDS" in result.stdout
@@ -9,6 +9,7 @@ IMPORTANT: These are NOT unit tests. These tests require:
 - Proper libcec installation on the Raspberry Pi
 - A compatible TV remote control
 """
+import functools
 import os
 import signal
 import sys
@@ -27,20 +28,73 @@ from pi_tv_remote.cec_adapter import (
     log_debug,
 )
 
+# Verbose per-command output, enabled with PI_TV_REMOTE_DEBUG=1
+_DEBUG = bool(os.environ.get("PI_TV_REMOTE_DEBUG"))
+
+# Opcode of the command a TV forwards for each remote button press (0x44)
+_USER_CONTROL_PRESSED = int(CECCommand.USER_CONTROL_PRESSED)
+# Opcode of the TV's reply to a power status request (0x90)
+_REPORT_POWER_STATUS = int(CECCommand.REPORT_POWER_STATUS)
+
 # Detected button presses will be stored here
 detected_buttons: Set[int] = set()
 button_event = threading.Event()
-stop_listening = threading.Event()
+# Wakes the listener thread on a button press, termination signal or teardown
+_wake = threading.Event()
+# Set when the TV reports that it is powered on
+_tv_ready = threading.Event()
 listener_thread = None
 
+# Bound once; the set and event are cleared in place, never rebound
+_add_detected = detected_buttons.add
+_signal_button = button_event.set
+
+# Display names for the buttons this test looks for
+_BUTTON_NAMES: Dict[int, str] = {
+    RemoteButton.SELECT: "SELECT",
+    RemoteButton.UP: "UP",
+    RemoteButton.DOWN: "DOWN",
+    RemoteButton.LEFT: "LEFT",
+    RemoteButton.RIGHT: "RIGHT",
+    RemoteButton.PLAY: "PLAY",
+    RemoteButton.PAUSE: "PAUSE",
+    RemoteButton.RED: "RED",
+    RemoteButton.GREEN: "GREEN",
+    RemoteButton.YELLOW: "YELLOW",
+    RemoteButton.BLUE: "BLUE",
+}
+
+# (button, name) pairs reported in the detection summary
+_NAV_BUTTONS = tuple(
+    (button, _BUTTON_NAMES[button])
+    for button in (
+        RemoteButton.UP,
+        RemoteButton.DOWN,
+        RemoteButton.LEFT,
+        RemoteButton.RIGHT,
+        RemoteButton.SELECT,
+        RemoteButton.PLAY,
+        RemoteButton.PAUSE,
+    )
+)
+_COLOR_BUTTONS = tuple(
+    (button, _BUTTON_NAMES[button])
+    for button in (
+        RemoteButton.RED,
+        RemoteButton.GREEN,
+        RemoteButton.YELLOW,
+        RemoteButton.BLUE,
+    )
+)
+
 
 # Set up signal handler for proper termination
 def signal_handler(sig, frame):
     """Handle termination signals to clean up resources."""
     print("\nTest interrupted. Cleaning up...")
-    stop_listening.set()
+    _wake.set()
     if listener_thread and listener_thread.is_alive():
-        listener_thread.join(timeout=2.0)
+        listener_thread.join(timeout=0.1)
     sys.exit(0)
 
 
@@ -51,158 +105,209 @@ signal.signal(signal.SIGTERM, signal_handler)
 
 def button_callback(key_code: int, duration: int) -> None:
     """Callback for button presses from remote."""
-    global detected_buttons
-
     # Add the button to the detected set
-    detected_buttons.add(key_code)
+    _add_detected(key_code)
 
     # Get button name
-    button_names = {
-        RemoteButton.SELECT: "SELECT",
-        RemoteButton.UP: "UP",
-        RemoteButton.DOWN: "DOWN",
-        RemoteButton.LEFT: "LEFT",
-        RemoteButton.RIGHT: "RIGHT",
-        RemoteButton.RED: "RED",
-        RemoteButton.GREEN: "GREEN",
-        RemoteButton.YELLOW: "YELLOW",
-        RemoteButton.BLUE: "BLUE",
-    }
-
-    button_name = button_names.get(key_code, f"UNKNOWN (0x{key_code:02x})")
+    button_name = _BUTTON_NAMES.get(key_code)
+    if button_name is None:
+        button_name = f"UNKNOWN (0x{key_code:02x})"
     print(f"✅ Detected button press: {button_name}")
 
     # Signal that a button was pressed
-    button_event.set()
+    _signal_button()
+    _wake.set()
+
+
+# Each extractor returns (opcode, params, source, destination, format name),
+# or None if the command is not in its format
+def _from_dict(cmd, args):
+    """Dict format."""
+    if "opcode" not in cmd:
+        return None
+    return (
+        cmd["opcode"],
+        cmd.get("parameters"),
+        cmd.get("initiator"),
+        cmd.get("destination"),
+        "Dictionary",
+    )
+
+
+def _from_int_format4(cmd, args):
+    """Format 4 with dict in args[0] - this matches what we're seeing."""
+    if cmd != 4 or not args or not isinstance(args[0], dict):
+        return None
+    cmd_dict = args[0]
+    return (
+        cmd_dict.get("opcode"),
+        cmd_dict.get("parameters"),
+        cmd_dict.get("initiator"),
+        cmd_dict.get("destination"),
+        "Format 4 with dictionary",
+    )
+
+
+def _from_object(cmd, args):
+    """Object format with opcode attribute."""
+    if not hasattr(cmd, "opcode"):
+        return None
+    return (
+        cmd.opcode,
+        getattr(cmd, "parameters", None),
+        getattr(cmd, "initiator", None),
+        getattr(cmd, "destination", None),
+        "Object with attributes",
+    )
+
+
+def _from_args(cmd, args):
+    """Classic format with source, dest, opcode, params in args."""
+    if len(args) < 3:
+        return None
+    params = args[3] if len(args) > 3 else None
+    return args[2], params, args[0], args[1], "Classic with positional args"
+
+
+# Extractors for the command types libcec is known to pass directly
+_DISPATCH = {dict: _from_dict, int: _from_int_format4}
+
+
+def _decode_command(cmd, args):
+    """Decode a CEC command in any known format, or return None."""
+    handler = _DISPATCH.get(type(cmd))
+    decoded = handler(cmd, args) if handler is not None else None
+    if decoded is None:
+        decoded = _from_object(cmd, args) or _from_args(cmd, args)
+    return decoded
+
+
+def _power_status_callback(cmd, *args) -> None:
+    """Signal _tv_ready when the TV reports that it is powered on."""
+    # Registered directly with cec, so this sees every command on the bus
+    decoded = _decode_command(cmd, args)
+    if decoded is not None:
+        opcode, params = decoded[0], decoded[1]
+        if opcode == _REPORT_POWER_STATUS and params and params[0] == 0:  # 0 = on
+            _tv_ready.set()
+
+
+def _wait_tv_ready(adapter: CECAdapter, timeout: float) -> bool:
+    """Poll the TV's power status until it reports on or the timeout expires."""
+    _tv_ready.clear()
+    deadline = time.monotonic() + timeout
+    while True:
+        adapter.request_power_status()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if _tv_ready.wait(min(1.0, remaining)):
+            return True
 
 
 def command_callback(cmd, *args) -> None:
     """Callback for CEC commands that might contain button presses."""
-    # Try to extract the command details
-    opcode = None
-    params = None
-    source = None
-    destination = None
-    is_button_press = False
-    button_code = None
-
-    try:
-        # Log all incoming commands with clear formatting
+    # Log all incoming commands with clear formatting
+    if _DEBUG:
         print(f"\n=== CEC COMMAND RECEIVED ===")
         print(f"Command: {cmd}")
         print(f"Args: {args}")
 
+    try:
         # Extract info based on the command format we're seeing
-        if isinstance(cmd, dict) and "opcode" in cmd:
-            # Dict format
-            opcode = cmd["opcode"]
-            params = cmd.get("parameters", None)
-            source = cmd.get("initiator", None)
-            destination = cmd.get("destination", None)
-            print(f"Format: Dictionary")
-        elif hasattr(cmd, "opcode"):
-            # Object format with opcode attribute
-            opcode = cmd.opcode
-            params = getattr(cmd, "parameters", None)
-            source = getattr(cmd, "initiator", None)
-            destination = getattr(cmd, "destination", None)
-            print(f"Format: Object with attributes")
-        elif (
+        decoded = _decode_command(cmd, args)
+        if decoded is None:
+            command_format = "Unknown"
+        else:
+            opcode, params, _, _, command_format = decoded
+
+            # For Format 4, check for USER_CONTROL_PRESSED (opcode 68 or 0x44)
+            if opcode == _USER_CONTROL_PRESSED and params:
+                # The button code is in the first byte of params
+                if hasattr(params, "__getitem__"):
+                    button_callback(params[0], 0)
+    except Exception as e:
+        print(f"Error in command callback: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return
+
+    if _DEBUG:
+        print(f"Format: {command_format}")
+
+
+# A special handler that processes CEC events directly. Shared state is bound
+# through default arguments so each event reads it from fast locals.
+def _handle_command(
+    cmd,
+    *args,
+    _add=_add_detected,
+    _signal=_signal_button,
+    _wake_up=_wake.set,
+    _names=_BUTTON_NAMES,
+):
+    try:
+        if _DEBUG:
+            print(f"DEBUG: Command received: {cmd}, args: {args}")
+
+        # For Format 4 which we're seeing in the logs
+        if (
             isinstance(cmd, int)
             and cmd == 4
             and len(args) > 0
             and isinstance(args[0], dict)
         ):
-            # Format 4 with dict in args[0] - this matches what we're seeing
             cmd_dict = args[0]
-            opcode = cmd_dict.get("opcode", None)
-            params = cmd_dict.get("parameters", None)
-            source = cmd_dict.get("initiator", None)
-            destination = cmd_dict.get("destination", None)
-            print(f"Format: Format 4 with dictionary")
-        elif len(args) >= 3:
-            # Classic format with source, dest, opcode, params in args
-            source = args[0]
-            destination = args[1]
-            opcode = args[2]
-            params = args[3] if len(args) > 3 else None
-            print(f"Format: Classic with positional args")
-        else:
-            # Unknown format
-            print(f"Format: Unknown")
-            return
+            opcode = cmd_dict.get("opcode")
+            params = cmd_dict.get("parameters", b"")
 
-        # For Format 4, check for USER_CONTROL_PRESSED (opcode 68 or 0x44)
-        if opcode == 68 or opcode == CECCommand.USER_CONTROL_PRESSED:
-            is_button_press = True
-
-            # The button code is in the first byte of params
-            if params and hasattr(params, "__getitem__"):
+            # User Control Pressed (0x44 or 68 decimal)
+            if opcode == _USER_CONTROL_PRESSED and params and len(params) > 0:
                 button_code = params[0]
-                print(f"✅ USER CONTROL PRESSED: Button code 0x{button_code:02x}")
-                button_callback(button_code, 0)
-
-        # Log the decoded command
-        print(f"Decoded command: opcode={opcode} (0x{opcode:02x} if numeric)")
-        print(f"Source: {source}, Destination: {destination}")
-        print(f"Parameters: {params}")
-        print(f"Is button press: {is_button_press}")
-        if button_code:
-            print(f"Button code: 0x{button_code:02x}")
-        print("=== END COMMAND ===\n")
+                button_name = _names.get(button_code)
+                if button_name is None:
+                    button_name = f"UNKNOWN (0x{button_code:02x})"
+                print(f"✅ TV REMOTE: {button_name} button (code: {button_code})")
+
+                # Add the button to detected buttons
+                _add(button_code)
 
+                # Signal that a button was pressed
+                _signal()
+                _wake_up()
     except Exception as e:
-        print(f"Error in command callback: {e}")
+        print(f"Error in command handler: {e}")
         import traceback
 
         traceback.print_exc()
 
 
+# Custom handler for FORMAT 4 commands; a partial adds no Python frame
+_custom_event_handler = functools.partial(_handle_command, 4)
+
+
 def wait_for_buttons_thread(max_wait_time: int = 60) -> None:
     """Thread that waits for button presses."""
-    start_time = time.time()
-
     # Brief monitoring message
     print("\nMonitoring for remote control button presses...")
 
-    while not stop_listening.is_set() and time.time() - start_time < max_wait_time:
-        # Check if button was pressed (with timeout)
-        if button_event.wait(1.0):
-            # Reset the event for next button press
-            button_event.clear()
+    # Sleep until a button is pressed, the test is stopped, or the time is up
+    _wake.wait(timeout=max_wait_time)
 
     # Print summary of detected buttons
     if detected_buttons:
         print("\n📊 Detection Summary:")
 
-        # Define the expected navigation buttons
-        nav_buttons = [
-            (RemoteButton.UP, "UP"),
-            (RemoteButton.DOWN, "DOWN"),
-            (RemoteButton.LEFT, "LEFT"),
-            (RemoteButton.RIGHT, "RIGHT"),
-            (RemoteButton.SELECT, "SELECT"),
-            (RemoteButton.PLAY, "PLAY"),
-            (RemoteButton.PAUSE, "PAUSE"),
-        ]
-
-        # Define the expected color buttons
-        color_buttons = [
-            (RemoteButton.RED, "RED"),
-            (RemoteButton.GREEN, "GREEN"),
-            (RemoteButton.YELLOW, "YELLOW"),
-            (RemoteButton.BLUE, "BLUE"),
-        ]
-
         # Report on navigation buttons
         print("\nNavigation Buttons:")
-        for button, name in nav_buttons:
+        for button, name in _NAV_BUTTONS:
             status = "✅ Detected" if button in detected_buttons else "❌ Not detected"
             print(f"{name}: {status}")
 
         # Report on color buttons
         print("\nColor Buttons:")
-        for button, name in color_buttons:
+        for button, name in _COLOR_BUTTONS:
             status = "✅ Detected" if button in detected_buttons else "❌ Not detected"
             print(f"{name}: {status}")
     else:
@@ -216,14 +321,14 @@ def cec_listener():
     if os.environ.get("NO_TV"):
         pytest.skip("NO_TV environment variable set, skipping real TV tests")
 
-    global detected_buttons, stop_listening, button_event, listener_thread
+    global listener_thread
 
     # Reset detected buttons
     detected_buttons.clear()
 
     # Reset events
     button_event.clear()
-    stop_listening.clear()
+    _wake.clear()
 
     # Create the adapter with a specific configuration
     config = CECConfig(
@@ -233,87 +338,34 @@ def cec_listener():
     )
     adapter = CECAdapter(config=config)
 
-    # Create a special handler that processes CEC events directly
-    def handle_command(cmd, *args):
-        global detected_buttons
-
-        try:
-            print(f"DEBUG: Command received: {cmd}, args: {args}")
-
-            # For Format 4 which we're seeing in the logs
-            if (
-                isinstance(cmd, int)
-                and cmd == 4
-                and len(args) > 0
-                and isinstance(args[0], dict)
-            ):
-                cmd_dict = args[0]
-                opcode = cmd_dict.get("opcode")
-                params = cmd_dict.get("parameters", b"")
-
-                # User Control Pressed (0x44 or 68 decimal)
-                if opcode == 68 and params and len(params) > 0:
-                    button_code = params[0]
-                    button_names = {
-                        1: "UP",
-                        2: "DOWN",
-                        3: "LEFT",
-                        4: "RIGHT",
-                        0: "SELECT",
-                        114: "RED",
-                        113: "GREEN",
-                        116: "YELLOW",
-                        113: "BLUE",
-                    }
-                    button_name = button_names.get(
-                        button_code, f"UNKNOWN (0x{button_code:02x})"
-                    )
-                    print(f"✅ TV REMOTE: {button_name} button (code: {button_code})")
-
-                    # Add the button to detected buttons
-                    detected_buttons.add(button_code)
-
-                    # Signal that a button was pressed
-                    button_event.set()
-        except Exception as e:
-            print(f"Error in command handler: {e}")
-            import traceback
-
-            traceback.print_exc()
-
     # Initialize the adapter
     if not adapter.init():
         pytest.skip("Failed to initialize CEC adapter - is a TV connected?")
 
     print("\n=== Setting up TV for Remote Control Test ===")
 
-    # Step 1: Force TV power on with multiple attempts
-    print("1. Turning on TV (sending multiple power-on commands)...")
-
-    # First attempt
-    adapter.power_on_tv()
-    print("   Sent first power-on command")
-    time.sleep(2)  # Wait for initial response
-
-    # Second attempt to ensure TV is on
-    adapter.power_on_tv()
-    print("   Sent second power-on command")
-    time.sleep(3)  # Wait longer for TV to fully power up
-
-    # Send active source immediately after power on
-    adapter.set_active_source()
-    print("   Sent active source command")
-    time.sleep(1)
+    # The adapter cannot decode the format-4 commands real hardware sends, so
+    # watch for the power status reply with a direct cec callback
+    event_command = cec.EVENT_COMMAND
+    event_keypress = cec.EVENT_KEYPRESS
+    if hasattr(cec, "add_callback"):
+        cec.add_callback(_power_status_callback, event_command)
 
-    # Send one more power on command to be sure
+    # Step 1: Power on the TV, retrying once if it does not report in time
+    print("1. Turning on TV...")
     adapter.power_on_tv()
-    print("   Sent final power-on command")
-    time.sleep(1)
+    print("   Sent power-on command")
+    if _wait_tv_ready(adapter, timeout=3.0):
+        print("   TV reports powered on")
+    else:
+        adapter.power_on_tv()
+        print("   TV not ready yet, sent second power-on command")
+        if not _wait_tv_ready(adapter, timeout=5.0):
+            print("   TV did not report powered on, continuing anyway")
 
-    # Step 2: Set as active source again
+    # Step 2: Set as active source
     print("2. Setting device as active source...")
     adapter.set_active_source()
-    time.sleep(1)
 
     print("=== Setup complete, listening for remote button presses ===")
     print("Press UP, DOWN, LEFT, RIGHT, SELECT, or color buttons on your TV remote")
@@ -321,17 +373,14 @@ def cec_listener():
     # Register for key press events
     if hasattr(cec, "add_callback"):
         print("Registering direct CEC callbacks for button presses")
-        cec.add_callback(handle_command, cec.EVENT_COMMAND)
-        cec.add_callback(adapter.handle_keypress, cec.EVENT_KEYPRESS)
+        cec.add_callback(_handle_command, event_command)
+        cec.add_callback(adapter.handle_keypress, event_keypress)
 
     # Add our command callback to detect user button presses (opcode 68 = 0x44 USER_CONTROL_PRESSED)
-    adapter.add_command_callback(68, command_callback)
+    adapter.add_command_callback(_USER_CONTROL_PRESSED, command_callback)
 
     # Add custom handler for FORMAT 4 commands
-    def custom_event_handler(*args):
-        handle_command(4, *args)
-
-    adapter.add_command_callback(CECCommand.USER_CONTROL_PRESSED, custom_event_handler)
+    adapter.add_command_callback(_USER_CONTROL_PRESSED, _custom_event_handler)
 
     # Start the thread that waits for button presses
     listener_thread = threading.Thread(target=wait_for_buttons_thread)
@@ -341,12 +390,12 @@ def cec_listener():
     # Yield the adapter for testing
     yield adapter
 
-    # Set the stop flag to signal the thread to exit
-    stop_listening.set()
+    # Wake the thread so it exits immediately
+    _wake.set()
 
     print("Waiting for listener thread to finish...")
-    # Wait for the thread to finish with a reasonable timeout
-    listener_thread.join(timeout=2.0)
+    # The thread only prints its summary once woken, so this is brief
+    listener_thread.join(timeout=0.1)
 
     # If thread is still alive after timeout, log a warning
     if listener_thread.is_alive():
@@ -355,8 +404,9 @@ def cec_listener():
     # Explicitly remove callbacks if possible
     if hasattr(cec, "remove_callback"):
         try:
-            cec.remove_callback(handle_command, cec.EVENT_COMMAND)
-            cec.remove_callback(adapter.handle_keypress, cec.EVENT_KEYPRESS)
+            cec.remove_callback(_power_status_callback, event_command)
+            cec.remove_callback(_handle_command, event_command)
+            cec.remove_callback(adapter.handle_keypress, event_keypress)
             print("Removed CEC callbacks")
         except:
             print("Failed to remove CEC callbacks")
@@ -371,8 +421,6 @@ def cec_listener():
 
 def test_detect_remote_buttons(cec_listener, request):
     """Test that detects buttons pressed on the real TV remote."""
-    global stop_listening
-
     # Get the maximum wait time from environment variable or use default
     max_wait_time = int(os.environ.get("REMOTE_WAIT_TIME", "60"))
 
@@ -387,32 +435,36 @@ def test_detect_remote_buttons(cec_listener, request):
     print("   2. Try pressing the HOME button on your remote first")
     print("   3. If all else fails, manually power on the TV with its remote\n")
 
-    # Wait for the wait_for_buttons_thread to complete
-    start_time = time.time()
+    # Report the time remaining every 5 seconds until the wait ends
+    deadline = time.monotonic() + max_wait_time
+    done = threading.Event()
+    timers: List[threading.Timer] = []
+
+    def report_progress() -> None:
+        remaining = int(deadline - time.monotonic())
+        if done.is_set() or remaining <= 0:
+            return
+        print(f"⏱️  {remaining} seconds remaining...")
+        schedule_progress()
+
+    def schedule_progress() -> None:
+        timer = threading.Timer(5.0, report_progress)
+        timer.daemon = True
+        timers.append(timer)
+        timer.start()
+
+    schedule_progress()
 
     try:
-        while time.time() - start_time < max_wait_time and not stop_listening.is_set():
-            # Give the user time to press buttons
-            time.sleep(10)
-
-            # If we've seen any buttons, we can exit early
-            if len(detected_buttons) > 0:
-                # We have detected at least one button
-                print(f"✅ Detected at least one button: {detected_buttons}")
-                break
-
-            # Update on time remaining every 5 seconds
-            elapsed = time.time() - start_time
-            remaining = max_wait_time - elapsed
-            if (
-                remaining > 0
-                and int(remaining) % 5 == 0
-                and int(remaining) < max_wait_time
-            ):
-                print(f"⏱️  {int(remaining)} seconds remaining...")
+        # Return as soon as the first button is detected
+        if button_event.wait(timeout=max_wait_time):
+            print(f"✅ Detected at least one button: {detected_buttons}")
     except KeyboardInterrupt:
         print("Test interrupted by user.")
-        stop_listening.set()
+        _wake.set()
+    finally:
+        done.set()
+        timers[-1].cancel()
 
     # Ensure we have at least one button press
     assert len(detected_buttons) > 0, "No buttons were detected during the test period"
@@ -422,8 +474,8 @@ def test_detect_remote_buttons(cec_listener, request):
     print(f"Total detected buttons: {len(detected_buttons)}")
     print(f"Button codes: {detected_buttons}")
 
-    # Signal to stop the listener thread
-    stop_listening.set()
+    # Wake the listener thread so it stops
+    _wake.set()
 
 
 if __name__ == "__main__":
@@ -435,6 +487,11 @@ if __name__ == "__main__":
         "  REMOTE_WAIT_TIME=30 pytest -xvs pi_tv_remote/tests/test_remote_listener.py"
     )
     print()
+    print("To print every received CEC command:")
+    print(
+        "  PI_TV_REMOTE_DEBUG=1 pytest -xvs pi_tv_remote/tests/test_remote_listener.py"
+    )
+    print()
     print("To skip all real TV tests (when no TV is connected):")
     print("  NO_TV=1 pytest -xvs pi_tv_remote/tests/test_remote_listener.py")
     print()
@@ -93,7 +93,7 @@ ssh $PI_USER@$PI_HOST "cd $REMOTE_DIR && \
                         python3 -m venv $VENV_DIR && \
                         source $VENV_DIR/bin/activate && \
                         pip install --upgrade pip && \
-                        pip install pytest cec"
+                        pip install pytest pytest-asyncio uvloop cec"
 
 # Copy files to Raspberry Pi
 echo "Copying files to Raspberry Pi..."